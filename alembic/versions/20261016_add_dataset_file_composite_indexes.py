@@ -0,0 +1,47 @@
+"""Add composite indexes on dataset_files
+
+Revision ID: 7g8h9i0j1k2l
+Revises: 6f7g8h9i0j1k
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7g8h9i0j1k2l"
+down_revision: str | None = "6f7g8h9i0j1k"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, columns)
+INDEXES = [
+    ("ix_dataset_files_dataset_path", ["dataset_id", "original_path"]),
+    ("ix_dataset_files_dataset_status", ["dataset_id", "status"]),
+    ("ix_dataset_files_dataset_camera", ["dataset_id", "camera_id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "dataset_files",
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns in INDEXES:
+            op.drop_index(
+                name,
+                "dataset_files",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
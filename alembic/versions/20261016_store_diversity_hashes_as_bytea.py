@@ -0,0 +1,59 @@
+"""Store frame diversity hashes as a packed bytea blob
+
+Revision ID: 8h9i0j1k2l3m
+Revises: 7g8h9i0j1k2l
+Create Date: 2026-10-16
+
+Cached diversity analyses are discarded; they are recomputed on the next
+analysis request.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8h9i0j1k2l3m"
+down_revision: str | None = "7g8h9i0j1k2l"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM frame_diversity_cache")
+    op.drop_column("frame_diversity_cache", "perceptual_hashes")
+    op.add_column(
+        "frame_diversity_cache",
+        sa.Column(
+            "frame_ids",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default="[]",
+        ),
+    )
+    op.add_column(
+        "frame_diversity_cache",
+        sa.Column(
+            "perceptual_hashes",
+            sa.LargeBinary(),
+            nullable=False,
+            server_default=sa.text("''::bytea"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM frame_diversity_cache")
+    op.drop_column("frame_diversity_cache", "perceptual_hashes")
+    op.drop_column("frame_diversity_cache", "frame_ids")
+    op.add_column(
+        "frame_diversity_cache",
+        sa.Column(
+            "perceptual_hashes",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default="{}",
+        ),
+    )
@@ -3,7 +3,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.db.session import get_db
@@ -133,18 +133,28 @@ async def delete_preset(
 
 
 @router.get("/model-info", response_model=ModelInfo)
-async def get_model_info() -> ModelInfo:
+async def get_model_info() -> Response:
     """
     Get information about available SAM 3 models.
+
+    Served from pre-serialized JSON since the payload is static.
     """
     service = ConfigService(None)
-    return await service.get_model_info()
+    return Response(
+        content=await service.get_model_info_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/system", response_model=SystemConfig)
-async def get_system_config() -> SystemConfig:
+async def get_system_config() -> Response:
     """
     Get system configuration and paths.
+
+    Served from pre-serialized JSON since the payload rarely changes.
     """
     service = ConfigService(None)
-    return await service.get_system_config()
+    return Response(
+        content=await service.get_system_config_json(),
+        media_type="application/json",
+    )
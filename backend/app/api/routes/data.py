@@ -23,14 +23,18 @@ router = APIRouter()
 async def get_data_summary(
     job_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
+    include_class_breakdown: Annotated[bool, Query()] = True,
 ) -> DataSummary:
     """
     Get summary of extracted data for a job.
 
     Returns statistics about frames, detections, and output files.
+    Set include_class_breakdown=false to skip counting detections by class.
     """
     service = DataService(db)
-    summary = await service.get_data_summary(job_id)
+    summary = await service.get_data_summary(
+        job_id, include_class_breakdown=include_class_breakdown
+    )
     if summary is None:
         raise HTTPException(status_code=404, detail="Job not found")
     return summary
@@ -87,7 +91,7 @@ async def get_frame_image(
         raise HTTPException(status_code=400, detail="Invalid image type")
 
     service = DataService(db)
-    file_path = service.get_frame_file_path(job_id, frame_id, image_type)
+    file_path = await service.get_frame_file_path(job_id, frame_id, image_type)
 
     if file_path is None or not file_path.exists():
         raise HTTPException(status_code=404, detail="Image not found")
@@ -116,7 +120,7 @@ async def get_frame_pointcloud(
     Returns PLY format point cloud data.
     """
     service = DataService(db)
-    file_path = service.get_frame_file_path(job_id, frame_id, "pointcloud")
+    file_path = await service.get_frame_file_path(job_id, frame_id, "pointcloud")
 
     if file_path is None or not file_path.exists():
         raise HTTPException(status_code=404, detail="Point cloud not found")
@@ -160,7 +164,7 @@ async def get_annotation_mask(
         annotation_id: Format is '{frame_id}_{detection_index}'
     """
     service = DataService(db)
-    file_path = service.get_mask_file_path(job_id, annotation_id)
+    file_path = await service.get_mask_file_path(job_id, annotation_id)
 
     if file_path is None or not file_path.exists():
         raise HTTPException(status_code=404, detail="Mask not found")
@@ -71,12 +71,17 @@ async def list_datasets(
 async def get_dataset(
     dataset_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
+    files_limit: Annotated[
+        int | None, Query(ge=0, description="Maximum files to include (all if omitted)")
+    ] = None,
 ) -> DatasetDetailResponse:
     """
     Get dataset details including discovered files.
+
+    Use /datasets/{id}/files to page through large file listings.
     """
     service = DatasetService(db)
-    dataset = await service.get_dataset(dataset_id)
+    dataset = await service.get_dataset(dataset_id, files_limit=files_limit)
     if dataset is None:
         raise HTTPException(status_code=404, detail="Dataset not found")
     return dataset
@@ -226,7 +231,7 @@ async def extract_all_files(
     service = DatasetService(db)
 
     # Verify dataset exists and has prepared files
-    dataset = await service.get_dataset(dataset_id)
+    dataset = await service.get_dataset(dataset_id, files_limit=0)
     if dataset is None:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
@@ -295,7 +300,7 @@ async def export_training_data(
     service = DatasetService(db)
 
     # Verify dataset exists
-    dataset = await service.get_dataset(dataset_id)
+    dataset = await service.get_dataset(dataset_id, files_limit=0)
     if dataset is None:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
@@ -14,6 +14,7 @@ from backend.app.schemas.review import (
     AnnotationStatsResponse,
     DiversityAnalysisRequest,
     DiversityAnalysisResponse,
+    DiversityFrameDetailsResponse,
     FrameBatchResponse,
     TrainingDatasetDetail,
     TrainingDatasetListResponse,
@@ -115,6 +116,7 @@ async def analyze_frame_diversity(
             similarity_threshold=request.similarity_threshold,
             motion_threshold=request.motion_threshold,
             camera=request.sample_camera,
+            include_details=request.include_details,
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from None
@@ -132,6 +134,7 @@ async def get_diversity_status(
     db: Annotated[AsyncSession, Depends(get_db)],
     similarity_threshold: Annotated[float, Query(ge=0, le=1)] = 0.85,
     motion_threshold: Annotated[float, Query(ge=0, le=1)] = 0.02,
+    include_details: bool = False,
 ) -> DiversityAnalysisResponse:
     """
     Get cached diversity analysis status or compute with default thresholds.
@@ -149,6 +152,7 @@ async def get_diversity_status(
                 similarity_threshold=similarity_threshold,
                 motion_threshold=motion_threshold,
                 use_cache=True,
+                include_details=include_details,
             )
 
         return DiversityAnalysisResponse(
@@ -159,6 +163,29 @@ async def get_diversity_status(
         raise HTTPException(status_code=404, detail=str(e)) from None
 
 
+@router.get(
+    "/jobs/{job_id}/diversity/frame-details",
+    response_model=DiversityFrameDetailsResponse,
+)
+async def get_diversity_frame_details(
+    job_id: UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=2000)] = 500,
+) -> DiversityFrameDetailsResponse:
+    """
+    Get per-frame perceptual hashes and motion scores from the cached analysis.
+
+    Paginated companion to the diversity analysis, which omits per-frame data
+    unless include_details is set.
+    """
+    try:
+        service = DiversityService(db)
+        return await service.get_frame_details(job_id, offset, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from None
+
+
 # =============================================================================
 # Training Dataset Management
 # =============================================================================
@@ -34,6 +34,9 @@ class Settings(BaseSettings):
     postgres_password: str = "svo2_analyzer_dev"
     postgres_db: str = "svo2_analyzer"
     database_url: PostgresDsn | None = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
 
     @field_validator("database_url", mode="before")
     @classmethod
@@ -18,6 +18,11 @@ STAGE_NUMBERS: Final[dict[str, int]] = {
     "tracking": 4,
 }
 
+# Stage name by number (inverse of STAGE_NUMBERS; 0 means no stage started)
+STAGE_NAMES: Final[dict[int, str]] = {
+    number: name for name, number in STAGE_NUMBERS.items()
+}
+
 # Stage weights for progress calculation (must sum to 1.0)
 STAGE_WEIGHTS: Final[dict[str, float]] = {
     "extraction": 0.25,
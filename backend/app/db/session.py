@@ -2,10 +2,11 @@
 
 import logging
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
 
 from backend.app.config import get_settings
 
@@ -13,12 +14,24 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Create async engine
+
+def _json_serializer(obj: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson (much faster than stdlib json)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Create async engine with a shared connection pool so requests reuse
+# warm connections instead of reconnecting to PostgreSQL each time
 engine = create_async_engine(
     str(settings.database_url),
     echo=settings.debug,
-    poolclass=NullPool,  # Use NullPool for async
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
     future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
@@ -38,7 +51,7 @@ async def init_db() -> None:
         async with engine.begin() as conn:
             # Test connection
             await conn.execute(text("SELECT 1"))
-        logger.info("Database connection established")
+        logger.info(f"Database connection established ({engine.pool.status()})")
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         raise
@@ -148,6 +148,7 @@ class DatasetFile(Base, UUIDMixin, TimestampMixin):
 
     # Composite indexes for common query patterns
     __table_args__ = (
+        Index("ix_dataset_files_dataset_path", "dataset_id", "original_path"),
         Index("ix_dataset_files_dataset_status", "dataset_id", "status"),
         Index("ix_dataset_files_dataset_camera", "dataset_id", "camera_id"),
     )
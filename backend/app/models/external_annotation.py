@@ -66,7 +66,9 @@ class AnnotationImport(Base, UUIDMixin, TimestampMixin):
 
     # Relationships
     annotations: Mapped[list["ExternalAnnotation"]] = relationship(
-        back_populates="import_record", cascade="all, delete-orphan"
+        back_populates="import_record",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
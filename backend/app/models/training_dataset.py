@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Integer, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -145,8 +145,11 @@ class FrameDiversityCache(Base, UUIDMixin, TimestampMixin):
     camera: Mapped[str] = mapped_column(String(10), default="left")
 
     # Per-frame data (computed once, reused)
-    perceptual_hashes: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
-    # { "frame_id": "hash_string", ... }
+    frame_ids: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    # [ "frame_id", ... ] - row order of perceptual_hashes
+
+    perceptual_hashes: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, default=b"")
+    # Packed dHash bytes, one fixed-width row per entry in frame_ids
 
     motion_scores: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
     # { "frame_id": 0.05, ... }
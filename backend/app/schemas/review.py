@@ -52,6 +52,10 @@ class DiversityAnalysisRequest(BaseModel):
         description="Frames with motion < threshold are considered low-motion",
     )
     sample_camera: Literal["left", "right"] = "left"
+    include_details: bool = Field(
+        default=False,
+        description="Include per-frame perceptual hashes and motion scores",
+    )
 
 
 class FrameCluster(BaseModel):
@@ -86,6 +90,25 @@ class DiversityAnalysisResponse(BaseModel):
     motion_scores: dict[int, float] = Field(default_factory=dict)
 
 
+class DiversityFrameDetail(BaseModel):
+    """Cached diversity metrics for one frame."""
+
+    frame_index: int
+    frame_id: str
+    perceptual_hash: str  # Hex dHash, empty if the frame could not be hashed
+    motion_score: float
+
+
+class DiversityFrameDetailsResponse(BaseModel):
+    """A page of per-frame diversity metrics."""
+
+    job_id: str
+    frames: list[DiversityFrameDetail]
+    total_frames: int
+    offset: int
+    has_more: bool
+
+
 # =============================================================================
 # Filter Configuration
 # =============================================================================
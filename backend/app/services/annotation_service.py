@@ -1,19 +1,25 @@
 """Annotation import and export service for CVAT and other tools."""
 
+import asyncio
+import io
 import json
 import logging
+import multiprocessing
 import os
-import xml.etree.ElementTree as ET
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.models.dataset import Dataset
 from backend.app.models.external_annotation import AnnotationImport, ExternalAnnotation
 from backend.app.models.frame import Frame
+from backend.app.models.job import ProcessingJob
 from backend.app.schemas.annotation import (
     AnnotationImportDetail,
     AnnotationImportResponse,
@@ -26,8 +32,141 @@ from backend.app.schemas.annotation import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
 OUTPUT_BASE = Path(os.getenv("PIPELINE_OUTPUT_DIR", "data/output"))
 
+# Imported annotations are flushed and released from the session in batches of this size
+ANNOTATION_FLUSH_BATCH_SIZE = 5000
+
+# CVAT XML exports of at least this size are considered for parallel parsing;
+# smaller ones are stream-parsed from disk without loading the file
+CVAT_PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+# CVAT XML exports with at least this many images are parsed in parallel
+CVAT_PARALLEL_PARSE_MIN_IMAGES = 10_000
+
+_CVAT_IMAGE_START = re.compile(rb"<image[\s/>]")
+_CVAT_IMAGE_TAG = "image"
+_CVAT_POINT_SHAPES = frozenset({"polygon", "polyline", "points"})
+
+
+def _parse_cvat_points(points_str: str) -> list[list[float]]:
+    """Parse a CVAT "x1,y1;x2,y2;..." points attribute."""
+    return [[float(x) for x in p.split(",")] for p in points_str.split(";") if p]
+
+
+def _parse_cvat_image(image: ET.Element) -> list[dict]:
+    """Extract annotations from a single CVAT <image> element."""
+    image_annotations: list[dict] = []
+
+    # Single pass over the image's shapes instead of one findall() per type
+    for shape in image:
+        tag = shape.tag
+        get = shape.get
+
+        if tag == "box":
+            xtl = float(get("xtl", 0))
+            ytl = float(get("ytl", 0))
+            xbr = float(get("xbr", 0))
+            ybr = float(get("ybr", 0))
+            ann = {
+                "type": "bbox",
+                "label": get("label", "unknown"),
+                "bbox_x": xtl,
+                "bbox_y": ytl,
+                "bbox_width": xbr - xtl,
+                "bbox_height": ybr - ytl,
+                "occurrence_id": int(get("occluded", 0)),
+                "z_order": int(get("z_order", 0)),
+                "attributes": {
+                    attr.get("name", ""): attr.text
+                    for attr in shape.iter("attribute")
+                },
+            }
+        elif tag in _CVAT_POINT_SHAPES:
+            ann = {
+                "type": tag,
+                "label": get("label", "unknown"),
+                "points": _parse_cvat_points(get("points", "")),
+                "z_order": int(get("z_order", 0)),
+                "attributes": {},
+            }
+            # Only polygon attributes are imported
+            if tag == "polygon":
+                ann["attributes"] = {
+                    attr.get("name", ""): attr.text
+                    for attr in shape.iter("attribute")
+                }
+        else:
+            continue
+
+        image_annotations.append(ann)
+
+    return image_annotations
+
+
+def _parse_cvat_xml_stream(source: str | BinaryIO) -> dict[str, list[dict]]:
+    """Stream-parse a CVAT XML document, one <image> element at a time.
+
+    Each image is cleared (and, with lxml, detached from the tree) once
+    parsed, so memory stays bounded by a single image instead of the DOM.
+    """
+    annotations: dict[str, list[dict]] = {}
+
+    # CVAT XML structure: <annotations><image name="..."><box>...</box></image></annotations>
+    if LXML_AVAILABLE:
+        context = ET.iterparse(source, events=("end",), tag=_CVAT_IMAGE_TAG)
+    else:
+        context = ET.iterparse(source, events=("end",))
+
+    for _, image in context:
+        if image.tag != _CVAT_IMAGE_TAG:
+            continue
+        annotations[image.get("name", "")] = _parse_cvat_image(image)
+
+        image.clear()
+        if LXML_AVAILABLE:
+            while image.getprevious() is not None:
+                del image.getparent()[0]
+
+    return annotations
+
+
+def _parse_cvat_xml_bytes(data: bytes) -> dict[str, list[dict]]:
+    """Parse a CVAT XML document from bytes.
+
+    Module-level so it can be dispatched to a ProcessPoolExecutor.
+    """
+    return _parse_cvat_xml_stream(io.BytesIO(data))
+
+
+def _split_cvat_xml(
+    data: bytes, image_starts: list[int], num_chunks: int
+) -> list[bytes]:
+    """Split CVAT XML into standalone documents of whole <image> elements.
+
+    Each chunk spans consecutive images and is wrapped in a synthetic
+    <annotations> root so it can be parsed independently.
+    """
+    end = data.rfind(b"</annotations>")
+    if end == -1 or not image_starts:
+        return [data]
+
+    per_chunk = -(-len(image_starts) // num_chunks)
+    chunks = []
+    for i in range(0, len(image_starts), per_chunk):
+        chunk_start = image_starts[i]
+        next_index = i + per_chunk
+        chunk_end = image_starts[next_index] if next_index < len(image_starts) else end
+        chunks.append(b"<annotations>" + data[chunk_start:chunk_end] + b"</annotations>")
+    return chunks
+
 
 class AnnotationService:
     """Service for importing and managing external annotations."""
@@ -70,38 +209,51 @@ class AnnotationService:
         await self.db.flush()
 
         try:
-            # Parse annotations based on format
+            # Parse annotations based on format (blocking, kept off the event loop)
             if source_format == "xml" and source_tool == "cvat":
-                annotations_data = self._parse_cvat_xml(source_file)
+                parse = self._parse_cvat_xml
             elif source_format == "json" and source_tool == "cvat":
-                annotations_data = self._parse_cvat_json(source_file)
+                parse = self._parse_cvat_json
             elif source_format == "coco":
-                annotations_data = self._parse_coco_json(source_file)
+                parse = self._parse_coco_json
             else:
                 raise ValueError(f"Unsupported format: {source_tool}/{source_format}")
+            annotations_data = await asyncio.to_thread(parse, source_file)
 
-            # Store annotations
+            # Store annotations, flushing in batches so the session does not
+            # hold every ExternalAnnotation instance until commit
             total_annotations = 0
             total_images = len(annotations_data)
-
-            for image_name, image_annotations in annotations_data.items():
-                for ann in image_annotations:
-                    ext_ann = ExternalAnnotation(
-                        import_id=annotation_import.id,
-                        source_image_name=image_name,
-                        label=ann["label"],
-                        annotation_type=ann["type"],
-                        bbox_x=ann.get("bbox_x"),
-                        bbox_y=ann.get("bbox_y"),
-                        bbox_width=ann.get("bbox_width"),
-                        bbox_height=ann.get("bbox_height"),
-                        points=ann.get("points"),
-                        attributes=ann.get("attributes"),
-                        occurrence_id=ann.get("occurrence_id"),
-                        z_order=ann.get("z_order", 0),
-                    )
-                    self.db.add(ext_ann)
-                    total_annotations += 1
+            labels: set[str] = set()
+            pending: list[ExternalAnnotation] = []
+
+            with self.db.no_autoflush:
+                for image_name, image_annotations in annotations_data.items():
+                    for ann in image_annotations:
+                        ext_ann = ExternalAnnotation(
+                            import_id=annotation_import.id,
+                            source_image_name=image_name,
+                            label=ann["label"],
+                            annotation_type=ann["type"],
+                            bbox_x=ann.get("bbox_x"),
+                            bbox_y=ann.get("bbox_y"),
+                            bbox_width=ann.get("bbox_width"),
+                            bbox_height=ann.get("bbox_height"),
+                            points=ann.get("points"),
+                            attributes=ann.get("attributes"),
+                            occurrence_id=ann.get("occurrence_id"),
+                            z_order=ann.get("z_order", 0),
+                        )
+                        self.db.add(ext_ann)
+                        pending.append(ext_ann)
+                        labels.add(ann["label"])
+                        total_annotations += 1
+
+                        if len(pending) >= ANNOTATION_FLUSH_BATCH_SIZE:
+                            await self.db.flush()
+                            for flushed in pending:
+                                self.db.expunge(flushed)
+                            pending.clear()
 
             # Update import record
             annotation_import.total_images = total_images
@@ -109,11 +261,7 @@ class AnnotationService:
             annotation_import.import_metadata = {
                 "source_tool": source_tool,
                 "source_format": source_format,
-                "labels": list({
-                    ann["label"]
-                    for anns in annotations_data.values()
-                    for ann in anns
-                }),
+                "labels": list(labels),
             }
 
             await self.db.commit()
@@ -153,99 +301,37 @@ class AnnotationService:
             raise
 
     def _parse_cvat_xml(self, file_path: Path) -> dict[str, list[dict]]:
-        """Parse CVAT XML annotation format."""
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        annotations: dict[str, list[dict]] = {}
-
-        # CVAT XML structure: <annotations><image name="..."><box>...</box></image></annotations>
-        for image in root.findall(".//image"):
-            image_name = image.get("name", "")
-            annotations[image_name] = []
-
-            # Parse boxes
-            for box in image.findall("box"):
-                ann = {
-                    "type": "bbox",
-                    "label": box.get("label", "unknown"),
-                    "bbox_x": float(box.get("xtl", 0)),
-                    "bbox_y": float(box.get("ytl", 0)),
-                    "bbox_width": float(box.get("xbr", 0)) - float(box.get("xtl", 0)),
-                    "bbox_height": float(box.get("ybr", 0)) - float(box.get("ytl", 0)),
-                    "occurrence_id": int(box.get("occluded", 0)),
-                    "z_order": int(box.get("z_order", 0)),
-                    "attributes": {},
-                }
+        """Parse CVAT XML annotation format.
 
-                # Parse attributes
-                for attr in box.findall("attribute"):
-                    attr_name = attr.get("name", "")
-                    ann["attributes"][attr_name] = attr.text
+        Exports are stream-parsed from disk. Only large exports on multi-core
+        hosts are read into memory, split into chunks of whole ``<image>``
+        elements and parsed in a process pool, since each image is independent.
+        """
+        workers = os.cpu_count() or 1
+        if workers < 2 or file_path.stat().st_size < CVAT_PARALLEL_PARSE_MIN_BYTES:
+            return _parse_cvat_xml_stream(str(file_path))
 
-                annotations[image_name].append(ann)
-
-            # Parse polygons
-            for polygon in image.findall("polygon"):
-                points_str = polygon.get("points", "")
-                points = [
-                    [float(x) for x in p.split(",")]
-                    for p in points_str.split(";")
-                    if p
-                ]
-
-                ann = {
-                    "type": "polygon",
-                    "label": polygon.get("label", "unknown"),
-                    "points": points,
-                    "z_order": int(polygon.get("z_order", 0)),
-                    "attributes": {},
-                }
-
-                for attr in polygon.findall("attribute"):
-                    attr_name = attr.get("name", "")
-                    ann["attributes"][attr_name] = attr.text
-
-                annotations[image_name].append(ann)
+        data = file_path.read_bytes()
+        image_starts = [m.start() for m in _CVAT_IMAGE_START.finditer(data)]
+        if len(image_starts) < CVAT_PARALLEL_PARSE_MIN_IMAGES:
+            return _parse_cvat_xml_bytes(data)
 
-            # Parse polylines
-            for polyline in image.findall("polyline"):
-                points_str = polyline.get("points", "")
-                points = [
-                    [float(x) for x in p.split(",")]
-                    for p in points_str.split(";")
-                    if p
-                ]
-
-                ann = {
-                    "type": "polyline",
-                    "label": polyline.get("label", "unknown"),
-                    "points": points,
-                    "z_order": int(polyline.get("z_order", 0)),
-                    "attributes": {},
-                }
-
-                annotations[image_name].append(ann)
-
-            # Parse points
-            for points_elem in image.findall("points"):
-                points_str = points_elem.get("points", "")
-                points = [
-                    [float(x) for x in p.split(",")]
-                    for p in points_str.split(";")
-                    if p
-                ]
-
-                ann = {
-                    "type": "points",
-                    "label": points_elem.get("label", "unknown"),
-                    "points": points,
-                    "z_order": int(points_elem.get("z_order", 0)),
-                    "attributes": {},
-                }
-
-                annotations[image_name].append(ann)
+        chunks = _split_cvat_xml(data, image_starts, workers)
+        if len(chunks) < 2:
+            return _parse_cvat_xml_bytes(data)
 
+        annotations: dict[str, list[dict]] = {}
+        # Spawn fresh workers rather than forking the (multi-threaded) API process
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            for part in executor.map(_parse_cvat_xml_bytes, chunks):
+                annotations.update(part)
+
+        logger.debug(
+            f"Parsed {len(image_starts)} CVAT images in {len(chunks)} parallel chunks"
+        )
         return annotations
 
     def _parse_cvat_json(self, file_path: Path) -> dict[str, list[dict]]:
@@ -349,28 +435,29 @@ class AnnotationService:
         match_by: str = "filename",
     ) -> int:
         """Match imported annotations to existing frames."""
-        # Get all frames for jobs linked to this dataset
+        # Get all frames for jobs linked to this dataset (only the matched columns)
         result = await self.db.execute(
-            select(Frame)
-            .join(Frame.job)
-            .where(Frame.job.has(dataset_id=dataset_id))
+            select(Frame.id, Frame.image_left_path, Frame.svo2_frame_index)
+            .join(ProcessingJob, Frame.job_id == ProcessingJob.id)
+            .where(ProcessingJob.dataset_id == dataset_id)
         )
-        frames = result.scalars().all()
+        frames = result.all()
 
         # Build lookup maps
         if match_by == "filename":
             # Map by image filename (e.g., "000000.png" -> frame_id)
             frame_lookup = {}
-            for frame in frames:
-                if frame.image_left_path:
-                    filename = Path(frame.image_left_path).name
-                    frame_lookup[filename] = frame.id
+            for frame_id, image_left_path, _ in frames:
+                if image_left_path:
+                    filename = Path(image_left_path).name
+                    frame_lookup[filename] = frame_id
                     # Also try without extension
-                    frame_lookup[Path(filename).stem] = frame.id
+                    frame_lookup[Path(filename).stem] = frame_id
         else:
             # Map by frame index
             frame_lookup = {
-                str(frame.svo2_frame_index): frame.id for frame in frames
+                str(svo2_frame_index): frame_id
+                for frame_id, _, svo2_frame_index in frames
             }
 
         # Match annotations
@@ -581,13 +668,20 @@ class AnnotationService:
         if imp is None:
             return None
 
-        # Count by label
-        label_counts = await self.db.execute(
-            select(ExternalAnnotation.label, func.count(ExternalAnnotation.id))
+        # Count by label, aggregated into a single JSON object server-side
+        label_counts = (
+            select(
+                ExternalAnnotation.label,
+                func.count(ExternalAnnotation.id).label("count"),
+            )
             .where(ExternalAnnotation.import_id == import_id)
             .group_by(ExternalAnnotation.label)
+            .subquery()
         )
-        labels = {row[0]: row[1] for row in label_counts.all()}
+        labels_result = await self.db.execute(
+            select(func.jsonb_object_agg(label_counts.c.label, label_counts.c.count))
+        )
+        labels = labels_result.scalar() or {}
 
         matched = imp.matched_frames
         total = imp.total_annotations
@@ -602,16 +696,19 @@ class AnnotationService:
         )
 
     async def delete_import(self, import_id: UUID) -> bool:
-        """Delete an annotation import and its annotations."""
+        """Delete an annotation import and its annotations.
+
+        Issues a single DELETE and relies on the ON DELETE CASCADE foreign key
+        to remove the external annotations, instead of loading every child
+        row through the ORM cascade.
+        """
         result = await self.db.execute(
-            select(AnnotationImport).where(AnnotationImport.id == import_id)
+            delete(AnnotationImport).where(AnnotationImport.id == import_id)
         )
-        imp = result.scalar_one_or_none()
-        if imp is None:
-            return False
-
-        await self.db.delete(imp)
         await self.db.commit()
 
+        if result.rowcount == 0:
+            return False
+
         logger.info(f"Deleted annotation import {import_id}")
         return True
@@ -1,8 +1,13 @@
 """Service for managing job performance benchmarks and pre-job time estimation."""
 
+import asyncio
 import logging
+import time
+from functools import cached_property
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import case, event, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.models.job import JobPerformanceBenchmark, ProcessingJob
@@ -33,6 +38,12 @@ DEFAULT_BENCHMARKS = {
     },
 }
 
+# EMA weight for new benchmark samples (0.3 = 30% new, 70% old)
+BENCHMARK_EMA_ALPHA = 0.3
+
+# How long a benchmark read from the database is served from the in-process cache
+BENCHMARK_CACHE_TTL_SECONDS = 30.0
+
 # Fallback defaults if model not found
 DEFAULT_FPS = {
     "extraction_fps": 30.0,
@@ -62,16 +73,36 @@ class PerformanceBenchmark:
         self.tracking_fps = tracking_fps
         self.sample_count = sample_count
         self.is_default = is_default
+        self._fps_map = {
+            "extraction": extraction_fps,
+            "segmentation": segmentation_fps,
+            "reconstruction": reconstruction_fps,
+            "tracking": tracking_fps,
+        }
 
     def get_stage_fps(self, stage: str) -> float:
         """Get FPS for a specific stage."""
-        fps_map = {
-            "extraction": self.extraction_fps,
-            "segmentation": self.segmentation_fps,
-            "reconstruction": self.reconstruction_fps,
-            "tracking": self.tracking_fps,
-        }
-        return fps_map.get(stage, 1.0)
+        return self._fps_map.get(stage, 1.0)
+
+
+def _default_benchmark(model_variant: str, defaults: dict[str, float]) -> PerformanceBenchmark:
+    """Build a default (non-historical) benchmark from a defaults mapping."""
+    return PerformanceBenchmark(
+        model_variant=model_variant,
+        extraction_fps=defaults.get("extraction_fps", DEFAULT_FPS["extraction_fps"]),
+        segmentation_fps=defaults.get("segmentation_fps", DEFAULT_FPS["segmentation_fps"]),
+        reconstruction_fps=defaults.get("reconstruction_fps", DEFAULT_FPS["reconstruction_fps"]),
+        tracking_fps=defaults.get("tracking_fps", DEFAULT_FPS["tracking_fps"]),
+        sample_count=0,
+        is_default=True,
+    )
+
+
+# Default benchmarks are immutable, so build them once and share the instances
+_DEFAULT_BENCHMARK_OBJS: dict[str, PerformanceBenchmark] = {
+    variant: _default_benchmark(variant, defaults)
+    for variant, defaults in DEFAULT_BENCHMARKS.items()
+}
 
 
 class JobDurationEstimate:
@@ -91,7 +122,7 @@ class JobDurationEstimate:
         self.confidence = confidence
         self.based_on_jobs = based_on_jobs
 
-    @property
+    @cached_property
     def estimated_duration_formatted(self) -> str:
         """Format duration as human-readable string."""
         seconds = self.estimated_duration_seconds
@@ -117,9 +148,39 @@ class JobDurationEstimate:
         }
 
 
+def _ema_update(
+    column: Any,
+    first: float | None,
+    fill: float | None,
+    sample: float | None,
+) -> Any:
+    """Build the ON CONFLICT SET expression for one averaged FPS column.
+
+    Args:
+        column: Existing benchmark column being updated
+        first: Value to use when no samples have been recorded yet
+        fill: Value to use when the column is still NULL
+        sample: New FPS sample to blend into the moving average
+    """
+    table = JobPerformanceBenchmark
+    return case(
+        (table.sample_count == 0, column if first is None else literal(first)),
+        (column.is_(None), column if fill is None else literal(fill)),
+        else_=(
+            column
+            if sample is None
+            else BENCHMARK_EMA_ALPHA * sample + (1 - BENCHMARK_EMA_ALPHA) * column
+        ),
+    )
+
+
 class BenchmarkService:
     """Service for managing performance benchmarks and estimating job durations."""
 
+    # Process-wide cache: model_variant -> (monotonic fetch time, benchmark)
+    _cache: dict[str, tuple[float, PerformanceBenchmark]] = {}
+    _cache_locks: dict[str, asyncio.Lock] = {}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -127,37 +188,61 @@ class BenchmarkService:
         """
         Get performance benchmark for a model variant.
 
+        Results are cached per variant for BENCHMARK_CACHE_TTL_SECONDS and
+        invalidated when this process updates the benchmark.
+        """
+        cached = BenchmarkService._cache.get(model_variant)
+        if cached and time.monotonic() - cached[0] < BENCHMARK_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        # Serialize refreshes per variant so concurrent misses issue one query
+        lock = BenchmarkService._cache_locks.setdefault(model_variant, asyncio.Lock())
+        async with lock:
+            cached = BenchmarkService._cache.get(model_variant)
+            if cached and time.monotonic() - cached[0] < BENCHMARK_CACHE_TTL_SECONDS:
+                return cached[1]
+
+            benchmark = await self._fetch_benchmark(model_variant)
+            BenchmarkService._cache[model_variant] = (time.monotonic(), benchmark)
+            return benchmark
+
+    async def _fetch_benchmark(self, model_variant: str) -> PerformanceBenchmark:
+        """
+        Fetch performance benchmark for a model variant.
+
         First tries to fetch from database, falls back to defaults if not found.
         """
-        # Try to get from database
-        query = select(JobPerformanceBenchmark).where(
-            JobPerformanceBenchmark.sam3_model_variant == model_variant
+        # Try to get from database (only the columns the estimate needs)
+        query = (
+            select(
+                JobPerformanceBenchmark.avg_extraction_fps,
+                JobPerformanceBenchmark.avg_segmentation_fps,
+                JobPerformanceBenchmark.avg_reconstruction_fps,
+                JobPerformanceBenchmark.avg_tracking_fps,
+                JobPerformanceBenchmark.sample_count,
+            )
+            .where(JobPerformanceBenchmark.sam3_model_variant == model_variant)
+            .limit(1)
         )
         result = await self.db.execute(query)
-        benchmark = result.scalar_one_or_none()
+        benchmark = result.mappings().one_or_none()
 
-        if benchmark and benchmark.sample_count > 0:
+        if benchmark and benchmark["sample_count"] > 0:
             return PerformanceBenchmark(
                 model_variant=model_variant,
-                extraction_fps=benchmark.avg_extraction_fps or DEFAULT_FPS["extraction_fps"],
-                segmentation_fps=benchmark.avg_segmentation_fps or DEFAULT_FPS["segmentation_fps"],
-                reconstruction_fps=benchmark.avg_reconstruction_fps or DEFAULT_FPS["reconstruction_fps"],
-                tracking_fps=benchmark.avg_tracking_fps or DEFAULT_FPS["tracking_fps"],
-                sample_count=benchmark.sample_count,
+                extraction_fps=benchmark["avg_extraction_fps"] or DEFAULT_FPS["extraction_fps"],
+                segmentation_fps=benchmark["avg_segmentation_fps"] or DEFAULT_FPS["segmentation_fps"],
+                reconstruction_fps=benchmark["avg_reconstruction_fps"] or DEFAULT_FPS["reconstruction_fps"],
+                tracking_fps=benchmark["avg_tracking_fps"] or DEFAULT_FPS["tracking_fps"],
+                sample_count=benchmark["sample_count"],
                 is_default=False,
             )
 
         # Fall back to defaults
-        defaults = DEFAULT_BENCHMARKS.get(model_variant, DEFAULT_FPS)
-        return PerformanceBenchmark(
-            model_variant=model_variant,
-            extraction_fps=defaults.get("extraction_fps", DEFAULT_FPS["extraction_fps"]),
-            segmentation_fps=defaults.get("segmentation_fps", DEFAULT_FPS["segmentation_fps"]),
-            reconstruction_fps=defaults.get("reconstruction_fps", DEFAULT_FPS["reconstruction_fps"]),
-            tracking_fps=defaults.get("tracking_fps", DEFAULT_FPS["tracking_fps"]),
-            sample_count=0,
-            is_default=True,
-        )
+        default_benchmark = _DEFAULT_BENCHMARK_OBJS.get(model_variant)
+        if default_benchmark is not None:
+            return default_benchmark
+        return _default_benchmark(model_variant, DEFAULT_FPS)
 
     async def update_benchmark_from_job(self, job: ProcessingJob) -> None:
         """
@@ -168,21 +253,17 @@ class BenchmarkService:
         if job.status != "completed":
             return
 
-        model_variant = job.config.sam3_model_variant if job.config else "sam3_hiera_large"
-
-        # Get existing benchmark or create new
-        query = select(JobPerformanceBenchmark).where(
-            JobPerformanceBenchmark.sam3_model_variant == model_variant
+        has_timing_data = (
+            job.extraction_duration_seconds
+            or job.segmentation_duration_seconds
+            or job.extraction_fps
+            or job.segmentation_fps
         )
-        result = await self.db.execute(query)
-        benchmark = result.scalar_one_or_none()
+        if not has_timing_data:
+            logger.debug("Skipping benchmark update for job %s: no timing data", job.id)
+            return
 
-        if not benchmark:
-            benchmark = JobPerformanceBenchmark(
-                sam3_model_variant=model_variant,
-                sample_count=0,
-            )
-            self.db.add(benchmark)
+        model_variant = job.config.sam3_model_variant if job.config else "sam3_hiera_large"
 
         # Calculate FPS values from job
         extraction_fps = None
@@ -196,41 +277,59 @@ class BenchmarkService:
             frames = job.total_frames or 0
             segmentation_fps = frames / job.segmentation_duration_seconds
 
-        # Update using exponential moving average
-        # Alpha controls how much weight to give new data (0.3 = 30% new, 70% old)
-        alpha = 0.3
-        count = benchmark.sample_count
-
-        if extraction_fps is not None:
-            if benchmark.avg_extraction_fps is None or count == 0:
-                benchmark.avg_extraction_fps = extraction_fps
-            else:
-                benchmark.avg_extraction_fps = (
-                    alpha * extraction_fps + (1 - alpha) * benchmark.avg_extraction_fps
-                )
-
-        if segmentation_fps is not None:
-            if benchmark.avg_segmentation_fps is None or count == 0:
-                benchmark.avg_segmentation_fps = segmentation_fps
-            else:
-                benchmark.avg_segmentation_fps = (
-                    alpha * segmentation_fps + (1 - alpha) * benchmark.avg_segmentation_fps
-                )
-
-        # Also use job-level FPS if available
-        if job.extraction_fps and (benchmark.avg_extraction_fps is None or count == 0):
-            benchmark.avg_extraction_fps = job.extraction_fps
-        if job.segmentation_fps and (benchmark.avg_segmentation_fps is None or count == 0):
-            benchmark.avg_segmentation_fps = job.segmentation_fps
-
-        benchmark.sample_count = count + 1
-
-        await self.db.commit()
+        # First sample prefers the job-level FPS; later samples use the EMA
+        first_extraction_fps = job.extraction_fps or extraction_fps
+        first_segmentation_fps = job.segmentation_fps or segmentation_fps
+
+        # Single INSERT ... ON CONFLICT DO UPDATE: no read-modify-write round trip
+        stmt = pg_insert(JobPerformanceBenchmark).values(
+            sam3_model_variant=model_variant,
+            avg_extraction_fps=first_extraction_fps,
+            avg_segmentation_fps=first_segmentation_fps,
+            sample_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobPerformanceBenchmark.sam3_model_variant],
+            set_={
+                "avg_extraction_fps": _ema_update(
+                    JobPerformanceBenchmark.avg_extraction_fps,
+                    first=first_extraction_fps,
+                    fill=extraction_fps if extraction_fps is not None else job.extraction_fps,
+                    sample=extraction_fps,
+                ),
+                "avg_segmentation_fps": _ema_update(
+                    JobPerformanceBenchmark.avg_segmentation_fps,
+                    first=first_segmentation_fps,
+                    fill=segmentation_fps if segmentation_fps is not None else job.segmentation_fps,
+                    sample=segmentation_fps,
+                ),
+                "sample_count": JobPerformanceBenchmark.sample_count + 1,
+                "updated_at": func.now(),
+            },
+        ).returning(
+            JobPerformanceBenchmark.avg_extraction_fps,
+            JobPerformanceBenchmark.avg_segmentation_fps,
+            JobPerformanceBenchmark.sample_count,
+        )
+        result = await self.db.execute(stmt)
+        avg_extraction_fps, avg_segmentation_fps, sample_count = result.one()
+
+        await self.db.flush()
+
+        # The caller commits; evict only once the new row is visible, otherwise a
+        # concurrent get_benchmark could re-cache the old committed row meanwhile
+        event.listen(
+            self.db.sync_session,
+            "after_commit",
+            lambda _session: BenchmarkService._cache.pop(model_variant, None),
+            once=True,
+        )
         logger.info(
-            f"Updated benchmark for {model_variant}: "
-            f"extraction={benchmark.avg_extraction_fps:.2f} fps, "
-            f"segmentation={benchmark.avg_segmentation_fps:.2f} fps, "
-            f"samples={benchmark.sample_count}"
+            "Updated benchmark for %s: extraction=%.2f fps, segmentation=%.2f fps, samples=%d",
+            model_variant,
+            avg_extraction_fps or 0.0,
+            avg_segmentation_fps or 0.0,
+            sample_count,
         )
 
     async def estimate_job_duration(
@@ -259,22 +358,18 @@ class BenchmarkService:
         benchmark = await self.get_benchmark(model_variant)
 
         # Calculate time for each stage
-        breakdown = {}
-        total_seconds = 0
-
-        for stage in stages:
-            fps = benchmark.get_stage_fps(stage)
-            if fps > 0:
-                stage_seconds = int(frames_to_process / fps)
-            else:
-                stage_seconds = 0
+        stage_fps = [benchmark.get_stage_fps(stage) for stage in stages]
+        stage_seconds = [int(frames_to_process / fps) if fps > 0 else 0 for fps in stage_fps]
 
-            breakdown[stage] = {
+        breakdown = {
+            stage: {
                 "frames": frames_to_process,
-                "estimated_seconds": stage_seconds,
+                "estimated_seconds": seconds,
                 "fps": round(fps, 2),
             }
-            total_seconds += stage_seconds
+            for stage, fps, seconds in zip(stages, stage_fps, stage_seconds, strict=True)
+        }
+        total_seconds = sum(stage_seconds)
 
         # Determine confidence level
         if benchmark.is_default:
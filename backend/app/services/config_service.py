@@ -1,10 +1,13 @@
 """Configuration management service."""
 
+import asyncio
 import logging
+import time
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.config import get_settings
@@ -24,6 +27,51 @@ from backend.app.schemas.config import (
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Available SAM 3 model variants (static, built once at import time)
+_MODEL_VARIANTS: list[ModelVariant] = [
+    ModelVariant(
+        name="sam3_hiera_tiny",
+        size_mb=400,
+        vram_required_gb=4.0,
+        recommended_for="Quick testing",
+    ),
+    ModelVariant(
+        name="sam3_hiera_small",
+        size_mb=900,
+        vram_required_gb=8.0,
+        recommended_for="Balanced performance",
+    ),
+    ModelVariant(
+        name="sam3_hiera_base",
+        size_mb=1800,
+        vram_required_gb=12.0,
+        recommended_for="Production (default)",
+    ),
+    ModelVariant(
+        name="sam3_hiera_large",
+        size_mb=2400,
+        vram_required_gb=16.0,
+        recommended_for="Maximum accuracy",
+    ),
+]
+
+# ZED SDK install probe cached as (monotonic probe time, installed)
+_ZED_PROBE_TTL_SECONDS = 60.0
+_zed_probe_cache: tuple[float, bool] | None = None
+
+
+async def _zed_sdk_installed() -> bool:
+    """Check whether the ZED SDK is installed, re-probing the filesystem at most once per TTL."""
+    global _zed_probe_cache
+
+    now = time.monotonic()
+    if _zed_probe_cache is not None and now - _zed_probe_cache[0] < _ZED_PROBE_TTL_SECONDS:
+        return _zed_probe_cache[1]
+
+    installed = await asyncio.to_thread(Path(settings.zed_sdk_path).exists)
+    _zed_probe_cache = (now, installed)
+    return installed
+
 
 class ConfigService:
     """Service for configuration management."""
@@ -38,22 +86,35 @@ class ConfigService:
         if self.db is None:
             return []
 
-        query = select(ObjectClass)
+        # Select only the response columns; skips ORM instance hydration.
+        # lambda_stmt caches the constructed statement per code location.
+        query = lambda_stmt(
+            lambda: select(
+                ObjectClass.id,
+                ObjectClass.name,
+                ObjectClass.prompt,
+                ObjectClass.color,
+                ObjectClass.kitti_type,
+                ObjectClass.is_preset,
+                ObjectClass.created_at,
+            )
+        )
         if not include_custom:
-            query = query.where(ObjectClass.is_preset == True)  # noqa: E712
+            query += lambda s: s.where(ObjectClass.is_preset == True)  # noqa: E712
+        query += lambda s: s.order_by(ObjectClass.name)
 
-        result = await self.db.execute(query.order_by(ObjectClass.name))
+        result = await self.db.execute(query)
         return [
             ObjectClassResponse(
-                id=obj.id,
-                name=obj.name,
-                prompt=obj.prompt,
-                color=obj.color,
-                kitti_type=obj.kitti_type,
-                is_preset=obj.is_preset,
-                created_at=obj.created_at,
+                id=row.id,
+                name=row.name,
+                prompt=row.prompt,
+                color=row.color,
+                kitti_type=row.kitti_type,
+                is_preset=row.is_preset,
+                created_at=row.created_at,
             )
-            for obj in result.scalars().all()
+            for row in result.all()
         ]
 
     async def create_object_class(
@@ -73,7 +134,7 @@ class ConfigService:
         self.db.add(obj)
         await self.db.flush()
 
-        logger.info(f"Created object class: {obj.name}")
+        logger.info("Created object class: %s", obj.name)
         return ObjectClassResponse(
             id=obj.id,
             name=obj.name,
@@ -112,17 +173,18 @@ class ConfigService:
             return False
 
         result = await self.db.execute(
-            select(ObjectClass).where(
+            delete(ObjectClass)
+            .where(
                 ObjectClass.id == class_id,
                 ObjectClass.is_preset == False,  # noqa: E712
             )
+            .returning(ObjectClass.name)
         )
-        obj = result.scalar_one_or_none()
-        if obj is None:
+        name = result.scalar_one_or_none()
+        if name is None:
             return False
 
-        await self.db.delete(obj)
-        logger.info(f"Deleted object class: {obj.name}")
+        logger.info("Deleted object class: %s", name)
         return True
 
     async def list_presets(self) -> list[PresetResponse]:
@@ -130,16 +192,26 @@ class ConfigService:
         if self.db is None:
             return []
 
-        result = await self.db.execute(select(Preset).order_by(Preset.name))
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(
+                    Preset.id,
+                    Preset.name,
+                    Preset.description,
+                    Preset.config,
+                    Preset.created_at,
+                ).order_by(Preset.name)
+            )
+        )
         return [
             PresetResponse(
-                id=p.id,
-                name=p.name,
-                description=p.description,
-                config=PresetConfig(**p.config),
-                created_at=p.created_at,
+                id=row.id,
+                name=row.name,
+                description=row.description,
+                config=PresetConfig(**row.config),
+                created_at=row.created_at,
             )
-            for p in result.scalars().all()
+            for row in result.all()
         ]
 
     async def create_preset(self, data: PresetCreate) -> PresetResponse:
@@ -155,7 +227,7 @@ class ConfigService:
         self.db.add(preset)
         await self.db.flush()
 
-        logger.info(f"Created preset: {preset.name}")
+        logger.info("Created preset: %s", preset.name)
         return PresetResponse(
             id=preset.id,
             name=preset.name,
@@ -190,66 +262,67 @@ class ConfigService:
             return False
 
         result = await self.db.execute(
-            select(Preset).where(Preset.id == preset_id)
+            delete(Preset).where(Preset.id == preset_id).returning(Preset.name)
         )
-        preset = result.scalar_one_or_none()
-        if preset is None:
+        name = result.scalar_one_or_none()
+        if name is None:
             return False
 
-        await self.db.delete(preset)
-        logger.info(f"Deleted preset: {preset.name}")
+        logger.info("Deleted preset: %s", name)
         return True
 
     async def get_model_info(self) -> ModelInfo:
         """Get SAM 3 model information."""
-        # TODO: Implement actual GPU detection
-        return ModelInfo(
-            available_models=[
-                ModelVariant(
-                    name="sam3_hiera_tiny",
-                    size_mb=400,
-                    vram_required_gb=4.0,
-                    recommended_for="Quick testing",
-                ),
-                ModelVariant(
-                    name="sam3_hiera_small",
-                    size_mb=900,
-                    vram_required_gb=8.0,
-                    recommended_for="Balanced performance",
-                ),
-                ModelVariant(
-                    name="sam3_hiera_base",
-                    size_mb=1800,
-                    vram_required_gb=12.0,
-                    recommended_for="Production (default)",
-                ),
-                ModelVariant(
-                    name="sam3_hiera_large",
-                    size_mb=2400,
-                    vram_required_gb=16.0,
-                    recommended_for="Maximum accuracy",
-                ),
-            ],
-            default_model=settings.sam3_model_variant,
-            loaded_model=None,
-            gpu_available=True,  # TODO: Detect
-            gpu_name="NVIDIA GeForce RTX 5090",  # TODO: Detect
-            gpu_vram_gb=32.0,  # TODO: Detect
-        )
+        return _build_model_info(settings.sam3_model_variant)
+
+    async def get_model_info_json(self) -> bytes:
+        """Get SAM 3 model information as cached, pre-serialized JSON."""
+        return _model_info_json(settings.sam3_model_variant)
 
     async def get_system_config(self) -> SystemConfig:
         """Get system configuration."""
-        zed_installed = Path(settings.zed_sdk_path).exists()
-
-        return SystemConfig(
-            app_name=settings.app_name,
-            app_version="1.0.0",
-            environment=settings.app_env,
-            data_root=str(settings.data_root),
-            svo2_directory=str(settings.svo2_directory),
-            output_directory=str(settings.output_directory),
-            models_directory=str(settings.models_directory),
-            zed_sdk_installed=zed_installed,
-            sam3_model_loaded=False,  # TODO: Check
-            gpu_available=True,  # TODO: Detect
-        )
+        return _build_system_config(await _zed_sdk_installed())
+
+    async def get_system_config_json(self) -> bytes:
+        """Get system configuration as cached, pre-serialized JSON."""
+        return _system_config_json(await _zed_sdk_installed())
+
+
+def _build_model_info(default_model: str) -> ModelInfo:
+    """Build the SAM 3 model information payload."""
+    # TODO: Implement actual GPU detection
+    return ModelInfo(
+        available_models=_MODEL_VARIANTS,
+        default_model=default_model,
+        loaded_model=None,
+        gpu_available=True,  # TODO: Detect
+        gpu_name="NVIDIA GeForce RTX 5090",  # TODO: Detect
+        gpu_vram_gb=32.0,  # TODO: Detect
+    )
+
+
+def _build_system_config(zed_installed: bool) -> SystemConfig:
+    """Build the system configuration payload."""
+    return SystemConfig(
+        app_name=settings.app_name,
+        app_version="1.0.0",
+        environment=settings.app_env,
+        data_root=str(settings.data_root),
+        svo2_directory=str(settings.svo2_directory),
+        output_directory=str(settings.output_directory),
+        models_directory=str(settings.models_directory),
+        zed_sdk_installed=zed_installed,
+        sam3_model_loaded=False,  # TODO: Check
+        gpu_available=True,  # TODO: Detect
+    )
+
+
+# Polled payloads only depend on their arguments, so cache the encoded JSON
+@lru_cache(maxsize=4)
+def _model_info_json(default_model: str) -> bytes:
+    return _build_model_info(default_model).model_dump_json().encode()
+
+
+@lru_cache(maxsize=2)
+def _system_config_json(zed_installed: bool) -> bytes:
+    return _build_system_config(zed_installed).model_dump_json().encode()
@@ -1,11 +1,12 @@
 """Service for managing curated datasets."""
 
 import logging
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from backend.app.models.curated_dataset import CuratedDataset
 from backend.app.models.job import ProcessingJob
@@ -60,30 +61,23 @@ class CuratedDatasetService:
         )
 
         self.db.add(curated)
-        await self.db.commit()
-        await self.db.refresh(curated)
+        await self.db.flush()
 
-        logger.info(f"Created curated dataset: {curated.name} (v{curated.version})")
+        # Re-select with relationships eagerly loaded (replaces refresh)
+        curated, training_count = await self._get_with_sources(curated.id)
 
-        return await self._to_response(curated)
+        logger.info("Created curated dataset: %s (v%s)", curated.name, curated.version)
+
+        return self._to_response(curated, training_count)
 
     async def get(self, curated_id: UUID) -> CuratedDatasetResponse | None:
         """Get a curated dataset by ID."""
-        query = (
-            select(CuratedDataset)
-            .options(
-                joinedload(CuratedDataset.source_job),
-                joinedload(CuratedDataset.source_dataset),
-            )
-            .where(CuratedDataset.id == curated_id)
-        )
-        result = await self.db.execute(query)
-        curated = result.unique().scalar_one_or_none()
+        curated, training_count = await self._get_with_sources(curated_id)
 
         if not curated:
             return None
 
-        return await self._to_response(curated)
+        return self._to_response(curated, training_count)
 
     async def list(
         self,
@@ -92,43 +86,48 @@ class CuratedDatasetService:
         job_id: UUID | None = None,
     ) -> CuratedDatasetListPaginated:
         """List curated datasets with pagination."""
-        # Base query
-        query = select(CuratedDataset).options(
-            joinedload(CuratedDataset.source_job),
-            joinedload(CuratedDataset.source_dataset),
+        # Base query; the window count returns the total alongside each page row.
+        # lambda_stmt caches the constructed statement per code location.
+        query = lambda_stmt(
+            lambda: select(CuratedDataset, func.count().over().label("total")).options(
+                selectinload(CuratedDataset.source_job),
+                selectinload(CuratedDataset.source_dataset),
+            )
         )
 
         # Filter by job if specified
         if job_id:
-            query = query.where(CuratedDataset.source_job_id == job_id)
-
-        # Get total count
-        count_query = select(func.count()).select_from(CuratedDataset)
-        if job_id:
-            count_query = count_query.where(CuratedDataset.source_job_id == job_id)
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+            query += lambda s: s.where(CuratedDataset.source_job_id == job_id)
 
         # Apply pagination and ordering
-        query = (
-            query.order_by(CuratedDataset.created_at.desc())
+        query += lambda s: (
+            s.order_by(CuratedDataset.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
 
         result = await self.db.execute(query)
-        curated_datasets = result.unique().scalars().all()
+        rows = result.all()
+        curated_datasets = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # Page is past the end, so no row carries the window count
+            count_query = select(func.count()).select_from(CuratedDataset)
+            if job_id:
+                count_query = count_query.where(CuratedDataset.source_job_id == job_id)
+            total_result = await self.db.execute(count_query)
+            total = total_result.scalar() or 0
+        else:
+            total = 0
+
+        # Count related training datasets for the whole page in one grouped query
+        training_counts = await self._training_counts([c.id for c in curated_datasets])
 
         # Build response items
         items = []
         for curated in curated_datasets:
-            # Count related training datasets
-            training_count_query = select(func.count()).select_from(TrainingDataset).where(
-                TrainingDataset.source_curated_dataset_id == curated.id
-            )
-            training_count_result = await self.db.execute(training_count_query)
-            training_count = training_count_result.scalar() or 0
-
             items.append(CuratedDatasetListResponse(
                 id=curated.id,
                 name=curated.name,
@@ -143,7 +142,7 @@ class CuratedDatasetService:
                 original_annotation_count=curated.original_annotation_count,
                 filtered_frame_count=curated.filtered_frame_count,
                 filtered_annotation_count=curated.filtered_annotation_count,
-                training_datasets_count=training_count,
+                training_datasets_count=training_counts.get(curated.id, 0),
                 created_at=curated.created_at,
             ))
 
@@ -167,10 +166,11 @@ class CuratedDatasetService:
         if data.description is not None:
             curated.description = data.description
 
-        await self.db.commit()
-        await self.db.refresh(curated)
+        await self.db.flush()
 
-        return await self._to_response(curated)
+        curated, training_count = await self._get_with_sources(curated_id)
+
+        return self._to_response(curated, training_count)
 
     async def delete(self, curated_id: UUID) -> bool:
         """Delete a curated dataset."""
@@ -179,24 +179,60 @@ class CuratedDatasetService:
             return False
 
         await self.db.delete(curated)
-        await self.db.commit()
+        await self.db.flush()
 
-        logger.info(f"Deleted curated dataset: {curated.name}")
+        logger.info("Deleted curated dataset: %s", curated.name)
         return True
 
-    async def _to_response(self, curated: CuratedDataset) -> CuratedDatasetResponse:
-        """Convert model to response schema."""
-        # Load relationships if needed
-        if not curated.source_job:
-            await self.db.refresh(curated, ["source_job", "source_dataset"])
+    async def _get_with_sources(
+        self, curated_id: UUID
+    ) -> tuple[CuratedDataset | None, int]:
+        """Load a curated dataset with its sources and training dataset count.
+
+        The count is a correlated subquery, so a single query returns both.
+        """
+        training_count = (
+            select(func.count())
+            .select_from(TrainingDataset)
+            .where(TrainingDataset.source_curated_dataset_id == CuratedDataset.id)
+            .correlate(CuratedDataset)
+            .scalar_subquery()
+        )
+        query = (
+            select(CuratedDataset, training_count.label("training_count"))
+            .options(
+                selectinload(CuratedDataset.source_job),
+                selectinload(CuratedDataset.source_dataset),
+            )
+            .where(CuratedDataset.id == curated_id)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None, 0
+        return row[0], row.training_count or 0
+
+    async def _training_counts(self, curated_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Count training datasets derived from each of the given curated datasets."""
+        if not curated_ids:
+            return {}
 
-        # Count related training datasets
-        training_count_query = select(func.count()).select_from(TrainingDataset).where(
-            TrainingDataset.source_curated_dataset_id == curated.id
+        query = (
+            select(TrainingDataset.source_curated_dataset_id, func.count())
+            .where(TrainingDataset.source_curated_dataset_id.in_(curated_ids))
+            .group_by(TrainingDataset.source_curated_dataset_id)
         )
-        training_count_result = await self.db.execute(training_count_query)
-        training_count = training_count_result.scalar() or 0
+        result = await self.db.execute(query)
+        return dict(result.all())
+
+    def _to_response(
+        self, curated: CuratedDataset, training_count: int
+    ) -> CuratedDatasetResponse:
+        """Convert model to response schema.
 
+        Expects source_job and source_dataset to be eagerly loaded.
+        """
         return CuratedDatasetResponse(
             id=curated.id,
             name=curated.name,
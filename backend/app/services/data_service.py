@@ -1,18 +1,26 @@
 """Data service for reading extracted frame data."""
 
-import json
+import asyncio
+import heapq
 import logging
 import os
+import re
+import sqlite3
+from collections import Counter, OrderedDict
 from collections.abc import Iterator
 from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID
 
+import numpy as np
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from backend.app.models.job import JobConfig, ProcessingJob
+from backend.app.models.job import ProcessingJob
 from backend.app.schemas.data import (
     AnnotationSummary,
     BBox2D,
@@ -25,31 +33,359 @@ from backend.app.schemas.data import (
     FrameSummary,
     SVO2FileSummary,
 )
+from processing.common.frame_index import query_frame_page
+from processing.common.sequence_summary import (
+    SUMMARY_FILENAME,
+    count_detections_by_class,
+    is_summary_current,
+)
 
 logger = logging.getLogger(__name__)
 
+# detections.json files at least this large are streamed instead of parsed whole
+DETECTIONS_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Number of job output dirs whose frame_id prefix map is kept in memory
+SEQ_PREFIX_CACHE_SIZE = 256
+
 
-@lru_cache(maxsize=128)
-def _load_frame_registry_cached(registry_path: str, mtime: float) -> dict[str, Any]:
-    """Load frame registry with caching based on file path and modification time.
+@lru_cache(maxsize=256)
+def _load_frame_registry_cached(registry_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Load frame registry with caching based on file path, modification time and size.
 
-    The mtime parameter ensures the cache is invalidated when the file changes.
+    The mtime_ns and size parameters ensure the cache is invalidated when the file changes.
     """
-    with open(registry_path) as f:
-        return json.load(f)
+    with open(registry_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
-def load_frame_registry(registry_path: Path) -> dict[str, Any] | None:
+@lru_cache(maxsize=32)
+def _load_detections_cached(detections_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Load detections file with caching based on file path, modification time and size."""
+    with open(detections_path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def load_frame_registry(registry_path: Path | str) -> dict[str, Any] | None:
     """Load frame registry with caching."""
-    if not registry_path.exists():
+    try:
+        st = os.stat(registry_path)
+    except OSError:
         return None
     try:
-        mtime = registry_path.stat().st_mtime
-        return _load_frame_registry_cached(str(registry_path), mtime)
+        return _load_frame_registry_cached(os.fspath(registry_path), st.st_mtime_ns, st.st_size)
     except Exception as e:
         logger.warning(f"Failed to load frame registry {registry_path}: {e}")
         return None
 
+
+def load_detections(detections_path: Path | str) -> dict[str, Any] | None:
+    """Load a sequence's detections.json with caching.
+
+    Files of DETECTIONS_STREAM_MIN_BYTES or more are parsed without caching, so
+    the cache never pins more than 32 small documents in memory.
+    """
+    try:
+        st = os.stat(detections_path)
+    except OSError:
+        return None
+    try:
+        if st.st_size >= DETECTIONS_STREAM_MIN_BYTES:
+            with open(detections_path, "rb") as f:
+                return orjson.loads(f.read())
+        return _load_detections_cached(os.fspath(detections_path), st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        logger.warning(f"Failed to load detections {detections_path}: {e}")
+        return None
+
+
+def _iter_sequence_dirs(output_dir: Path) -> Iterator[os.DirEntry]:
+    """Yield sequence subdirectories of a job output directory.
+
+    Uses os.scandir so the directory check reuses the cached dirent type
+    instead of issuing a stat() per entry.
+    """
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                yield entry
+
+
+@lru_cache(maxsize=256)
+def _sequence_frame_index_cached(
+    registry_path: str, mtime_ns: int, size: int
+) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Build a frame_id -> (svo2_file, frame) index for one sequence registry."""
+    registry = _load_frame_registry_cached(registry_path, mtime_ns, size)
+    svo2_file = registry.get("svo2_file", os.path.basename(os.path.dirname(registry_path)))
+    index: dict[str, tuple[str, dict[str, Any]]] = {}
+    for frame in registry.get("frames", []):
+        index.setdefault(frame.get("frame_id"), (svo2_file, frame))
+    return index
+
+
+def _load_sequence_frame_index(seq_dir: str) -> dict[str, tuple[str, dict[str, Any]]] | None:
+    """Get the cached frame index for a sequence directory."""
+    registry_path = os.path.join(seq_dir, "frame_registry.json")
+    try:
+        st = os.stat(registry_path)
+    except OSError:
+        return None
+    try:
+        return _sequence_frame_index_cached(registry_path, st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        logger.warning(f"Failed to load frame registry {registry_path}: {e}")
+        return None
+
+
+# Job output dir -> {frame_id prefix: sequence directory name}, least recently used first
+_seq_prefix_cache: OrderedDict[str, dict[str, str]] = OrderedDict()
+
+
+def _frame_id_prefix(frame_id: str) -> str:
+    """Get the sequence prefix of a frame_id ('{svo2_hash}_{index:06d}')."""
+    return frame_id.rsplit("_", 1)[0]
+
+
+def find_frame(output_dir: Path, frame_id: str) -> tuple[Path, str, dict[str, Any]] | None:
+    """Resolve a frame_id to (seq_dir, svo2_file, frame).
+
+    Once a sequence's frame_id prefix has been seen, only that sequence's
+    registry is consulted. Unknown prefixes fall back to scanning all sequences.
+    """
+    cache_key = str(output_dir)
+    prefixes = _seq_prefix_cache.get(cache_key)
+    if prefixes is None:
+        prefixes = _seq_prefix_cache[cache_key] = {}
+        if len(_seq_prefix_cache) > SEQ_PREFIX_CACHE_SIZE:
+            _seq_prefix_cache.popitem(last=False)
+    else:
+        _seq_prefix_cache.move_to_end(cache_key)
+
+    seq_name = prefixes.get(_frame_id_prefix(frame_id))
+    if seq_name is not None:
+        seq_dir = os.path.join(output_dir, seq_name)
+        index = _load_sequence_frame_index(seq_dir)
+        if index is not None and frame_id in index:
+            svo2_file, frame = index[frame_id]
+            return Path(seq_dir), svo2_file, frame
+        # The job was re-extracted or cleaned up; rebuild its prefixes from the scan below
+        prefixes.clear()
+
+    for entry in sorted(_iter_sequence_dirs(output_dir), key=lambda e: e.name):
+        index = _load_sequence_frame_index(entry.path)
+        if not index:
+            continue
+        for prefix in {_frame_id_prefix(fid) for fid in index if fid}:
+            prefixes[prefix] = entry.name
+        if frame_id in index:
+            svo2_file, frame = index[frame_id]
+            return Path(entry.path), svo2_file, frame
+
+    return None
+
+
+# Frame file type -> frame registry key
+_FRAME_FILE_KEYS = {
+    "left": "image_left",
+    "right": "image_right",
+    "depth": "depth",
+    "pointcloud": "point_cloud",
+}
+
+
+def _resolve_frame_file_paths(
+    output_dir: Path, frame_ids: list[str], path_key: str
+) -> dict[str, Path]:
+    """Resolve frame_ids to the existing files stored under a registry key."""
+    paths: dict[str, Path] = {}
+    for frame_id in frame_ids:
+        indexed = find_frame(output_dir, frame_id)
+        if indexed is None:
+            continue
+        seq_dir, _svo2_file, frame = indexed
+        if frame.get(path_key):
+            path = seq_dir / frame[path_key]
+            if path.exists():
+                paths[frame_id] = path
+    return paths
+
+
+@lru_cache(maxsize=64)
+def _list_mask_names_cached(masks_dir: str, mtime_ns: int) -> frozenset[str]:
+    """List mask file names with caching based on the directory modification time.
+
+    The directory mtime changes whenever a mask file is added or removed.
+    """
+    with os.scandir(masks_dir) as it:
+        return frozenset(entry.name for entry in it)
+
+
+def _list_mask_names(masks_dir: str) -> frozenset[str]:
+    """Get the names of all mask files in a sequence's masks directory."""
+    try:
+        mtime_ns = os.stat(masks_dir).st_mtime_ns
+        return _list_mask_names_cached(masks_dir, mtime_ns)
+    except OSError:
+        return frozenset()
+
+
+# Annotation IDs are "{frame_id}_{detection_index}" where frame_id is like
+# "abc123_000000", so annotation IDs look like "abc123_000000_0" or "abc123_000000_12"
+_ANN_RE = re.compile(r"(.+)_(\d+)")
+
+
+@lru_cache(maxsize=1024)
+def _parse_annotation_id(annotation_id: str) -> tuple[str, int] | None:
+    """Split an annotation ID into (frame_id, detection_index)."""
+    m = _ANN_RE.fullmatch(annotation_id)
+    if m is None:
+        return None
+    return m.group(1), int(m.group(2))
+
+
+def _find_mask_file(output_dir: Path, mask_name: str) -> Path | None:
+    """Find a mask file in any sequence directory of a job."""
+    for entry in _iter_sequence_dirs(output_dir):
+        # Mask files are stored as: detections/masks/{frame_id}_{idx:03d}.png
+        mask_file = os.path.join(entry.path, "detections", "masks", mask_name)
+        if os.path.exists(mask_file):
+            return Path(mask_file)
+    return None
+
+
+def _count_detections_by_class(detections_file: Path) -> Counter[str]:
+    """Count detections per class, streaming files too large to cache whole."""
+    try:
+        size = os.stat(detections_file).st_size
+    except OSError:
+        return Counter()
+
+    if size >= DETECTIONS_STREAM_MIN_BYTES:
+        return count_detections_by_class(detections_file)
+
+    by_class: Counter[str] = Counter()
+    detections_data = load_detections(detections_file)
+    if detections_data is not None:
+        for frame_data in detections_data.get("frames", {}).values():
+            by_class.update(
+                det.get("class_name", "unknown") for det in frame_data.get("detections", [])
+            )
+    return by_class
+
+
+def _load_sequence_summary(seq_dir: Path) -> dict[str, Any] | None:
+    """Load a sequence's summary.json sidecar if it is still current."""
+    try:
+        with open(seq_dir / SUMMARY_FILENAME, "rb") as f:
+            summary = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    if not is_summary_current(seq_dir, summary):
+        return None
+    return summary
+
+
+def _summarize_sequence(
+    seq_dir: Path,
+    include_class_breakdown: bool = False,
+) -> tuple[SVO2FileSummary, dict[str, int], dict[str, int]] | None:
+    """Aggregate frame and detection counts for one sequence directory.
+
+    Returns (svo2 file summary, file counts, detections by class), or None if the
+    sequence has no readable frame registry. Uses the summary.json sidecar written
+    by the worker when it is current, and falls back to parsing the registry and
+    detections otherwise. detections.json is only parsed when the class
+    breakdown is requested; otherwise detections by class is empty.
+    """
+    summary = _load_sequence_summary(seq_dir)
+    if summary is not None:
+        counts = summary["counts"]
+        svo2_summary = SVO2FileSummary(
+            filename=summary["svo2_file"],
+            path=str(seq_dir),
+            total_frames_original=summary["total_frames"],
+            frames_extracted=counts["frames"],
+            frame_skip=summary["frame_skip"],
+        )
+        return svo2_summary, counts, summary["by_class"] if include_class_breakdown else {}
+
+    registry_file = seq_dir / "frame_registry.json"
+    registry = load_frame_registry(registry_file)
+    if registry is None:
+        return None
+
+    try:
+        frames = registry.get("frames", [])
+
+        # Count files
+        left = right = depth = pointcloud = detections = 0
+        for frame in frames:
+            get = frame.get
+            if get("image_left"):
+                left += 1
+            if get("image_right"):
+                right += 1
+            if get("depth"):
+                depth += 1
+            if get("point_cloud"):
+                pointcloud += 1
+            detections += get("detection_count", 0)
+
+        counts = {
+            "frames": len(frames),
+            "left": left,
+            "right": right,
+            "depth": depth,
+            "pointcloud": pointcloud,
+            "detections": detections,
+        }
+
+        # Get SVO2 file info
+        svo2_summary = SVO2FileSummary(
+            filename=registry.get("svo2_file", seq_dir.name),
+            path=str(seq_dir),
+            total_frames_original=registry.get("total_frames"),
+            frames_extracted=len(frames),
+            frame_skip=registry.get("config", {}).get("frame_skip", 1),
+        )
+
+        # Load detections to count by class
+        detections_by_class: Counter[str] = Counter()
+        if include_class_breakdown:
+            detections_by_class = _count_detections_by_class(
+                seq_dir / "detections" / "detections.json"
+            )
+
+        return svo2_summary, counts, detections_by_class
+
+    except Exception as e:
+        logger.error(f"Error reading registry {registry_file}: {e}")
+        return None
+
+
+# Default colors for common classes
+_CLASS_COLORS = MappingProxyType({
+    "person": "#ef4444",
+    "pedestrian": "#ef4444",
+    "car": "#3b82f6",
+    "truck": "#8b5cf6",
+    "van": "#6366f1",
+    "cyclist": "#22c55e",
+    "motorcycle": "#f59e0b",
+    "traffic light": "#eab308",
+    "traffic sign": "#f97316",
+})
+_DEFAULT_CLASS_COLOR = "#6b7280"
+
+
+@lru_cache(maxsize=256)
+def _class_color(class_name: str) -> str:
+    """Get color for a class name (class names come from a small vocabulary)."""
+    return _CLASS_COLORS.get(class_name.lower(), _DEFAULT_CLASS_COLOR)
+
+
 # Base output directory (configurable via environment)
 OUTPUT_BASE = Path(os.getenv("PIPELINE_OUTPUT_DIR", "data/output"))
 
@@ -59,20 +395,41 @@ class DataService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Jobs loaded by this (request-scoped) service instance, keyed by job id
+        self._jobs: dict[str, ProcessingJob | None] = {}
+
+    async def _get_job(self, job_id: UUID) -> ProcessingJob | None:
+        """Get a job with its config eagerly loaded, memoized per service instance."""
+        key = str(job_id)
+        if key not in self._jobs:
+            result = await self.db.execute(
+                select(ProcessingJob)
+                .options(joinedload(ProcessingJob.config, innerjoin=True))
+                .where(ProcessingJob.id == job_id)
+            )
+            self._jobs[key] = result.scalar_one_or_none()
+        return self._jobs[key]
+
+    async def get_data_summary(
+        self,
+        job_id: UUID,
+        include_class_breakdown: bool = False,
+    ) -> DataSummary | None:
+        """
+        Get summary of extracted data for a job.
 
-    async def get_data_summary(self, job_id: UUID) -> DataSummary | None:
-        """Get summary of extracted data for a job."""
+        Args:
+            job_id: The job UUID
+            include_class_breakdown: Also count detections by class. Totals come
+                from the frame registries, so this is only needed for
+                detections_by_class.
+        """
         # Get job from database
-        result = await self.db.execute(
-            select(ProcessingJob, JobConfig)
-            .join(JobConfig)
-            .where(ProcessingJob.id == job_id)
-        )
-        row = result.first()
-        if row is None:
+        job = await self._get_job(job_id)
+        if job is None:
             return None
 
-        job, config = row[0], row[1]
+        config = job.config
 
         # Find output directory
         output_dir = OUTPUT_BASE / str(job_id)
@@ -94,58 +451,30 @@ class DataService:
         frames_with_depth = 0
         frames_with_pc = 0
         total_detections = 0
-        detections_by_class: dict[str, int] = {}
+        detections_by_class: Counter[str] = Counter()
         svo2_files: list[SVO2FileSummary] = []
 
-        # Find all sequence directories
-        for seq_dir in output_dir.iterdir():
-            if not seq_dir.is_dir():
-                continue
-
-            registry_file = seq_dir / "frame_registry.json"
-            registry = load_frame_registry(registry_file)
-            if registry is None:
-                continue
-
-            try:
-                frames = registry.get("frames", [])
-                total_frames += len(frames)
-
-                # Count files
-                for frame in frames:
-                    if frame.get("image_left"):
-                        frames_with_left += 1
-                    if frame.get("image_right"):
-                        frames_with_right += 1
-                    if frame.get("depth"):
-                        frames_with_depth += 1
-                    if frame.get("point_cloud"):
-                        frames_with_pc += 1
-                    total_detections += frame.get("detection_count", 0)
-
-                # Get SVO2 file info
-                svo2_file = registry.get("svo2_file", seq_dir.name)
-                svo2_files.append(SVO2FileSummary(
-                    filename=svo2_file,
-                    path=str(seq_dir),
-                    total_frames_original=registry.get("total_frames"),
-                    frames_extracted=len(frames),
-                    frame_skip=registry.get("config", {}).get("frame_skip", 1),
-                ))
+        # Summarize all sequence directories concurrently
+        seq_dirs = [Path(entry.path) for entry in _iter_sequence_dirs(output_dir)]
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(_summarize_sequence, seq_dir, include_class_breakdown)
+                for seq_dir in seq_dirs
+            )
+        )
 
-                # Load detections to count by class
-                detections_file = seq_dir / "detections" / "detections.json"
-                if detections_file.exists():
-                    with open(detections_file) as f:
-                        detections_data = json.load(f)
-                    for frame_data in detections_data.get("frames", {}).values():
-                        for det in frame_data.get("detections", []):
-                            cls = det.get("class_name", "unknown")
-                            detections_by_class[cls] = detections_by_class.get(cls, 0) + 1
-
-            except Exception as e:
-                logger.error(f"Error reading registry {registry_file}: {e}")
+        for result in results:
+            if result is None:
                 continue
+            svo2_summary, counts, seq_by_class = result
+            total_frames += counts["frames"]
+            frames_with_left += counts["left"]
+            frames_with_right += counts["right"]
+            frames_with_depth += counts["depth"]
+            frames_with_pc += counts["pointcloud"]
+            total_detections += counts["detections"]
+            svo2_files.append(svo2_summary)
+            detections_by_class.update(seq_by_class)
 
         return DataSummary(
             job_id=str(job_id),
@@ -157,7 +486,7 @@ class DataService:
             frames_with_depth=frames_with_depth,
             frames_with_pointcloud=frames_with_pc,
             total_detections=total_detections,
-            detections_by_class=detections_by_class,
+            detections_by_class=dict(detections_by_class),
             total_tracks=0,  # TODO: Count from tracks.json
             svo2_files=svo2_files,
             output_directory=str(output_dir) if output_dir.exists() else None,
@@ -166,55 +495,33 @@ class DataService:
             completed_at=job.completed_at,
         )
 
+    async def _load_registries(self, output_dir: Path) -> list[tuple[Path, dict[str, Any]]]:
+        """Load all sequence registries of a job concurrently, ordered by sequence directory."""
+        seq_dirs = sorted(entry.path for entry in _iter_sequence_dirs(output_dir))
+        registries = await asyncio.gather(*(
+            asyncio.to_thread(load_frame_registry, os.path.join(seq_dir, "frame_registry.json"))
+            for seq_dir in seq_dirs
+        ))
+        return [
+            (Path(seq_dir), registry)
+            for seq_dir, registry in zip(seq_dirs, registries, strict=True)
+            if registry is not None
+        ]
+
     def _iter_frames_from_registry(
         self,
-        job_id: UUID,
-        output_dir: Path,
+        registries: list[tuple[Path, dict[str, Any]]],
     ) -> Iterator[tuple[dict, str, Path]]:
         """
-        Iterate over all frames from registry files.
+        Iterate over all frames from loaded registries.
 
         Yields:
             Tuple of (frame_dict, svo2_file, seq_dir)
         """
-        for seq_dir in sorted(output_dir.iterdir()):
-            if not seq_dir.is_dir():
-                continue
-
-            registry_file = seq_dir / "frame_registry.json"
-            registry = load_frame_registry(registry_file)
-            if registry is None:
-                continue
-
-            try:
-                svo2_file = registry.get("svo2_file", seq_dir.name)
-
-                for frame in registry.get("frames", []):
-                    yield (frame, svo2_file, seq_dir)
-
-            except Exception as e:
-                logger.error(f"Error reading registry {registry_file}: {e}")
-                continue
-
-    def _get_frame_count(self, output_dir: Path) -> int:
-        """Get total frame count from all registries (cached metadata)."""
-        total = 0
-        for seq_dir in output_dir.iterdir():
-            if not seq_dir.is_dir():
-                continue
-
-            registry_file = seq_dir / "frame_registry.json"
-            if not registry_file.exists():
-                continue
-
-            try:
-                with open(registry_file) as f:
-                    registry = json.load(f)
-                total += len(registry.get("frames", []))
-            except Exception:
-                continue
-
-        return total
+        for seq_dir, registry in registries:
+            svo2_file = registry.get("svo2_file", seq_dir.name)
+            for frame in registry.get("frames", []):
+                yield (frame, svo2_file, seq_dir)
 
     async def list_frames(
         self,
@@ -234,41 +541,76 @@ class DataService:
                 job_id=str(job_id),
             )
 
-        # Get total count (lightweight - just counts from registry metadata)
-        total = self._get_frame_count(output_dir)
-
-        # Collect frames for the requested page
-        # Use generator to avoid loading all frames at once
-        frames_collected: list[tuple[int, FrameSummary]] = []
-        current_index = 0
-
-        for frame, svo2_file, _seq_dir in self._iter_frames_from_registry(job_id, output_dir):
-            seq_idx = frame.get("sequence_index", 0)
+        page = None
+        try:
+            page = await asyncio.to_thread(query_frame_page, output_dir, limit, offset)
+        except sqlite3.Error as e:
+            logger.warning(f"Frame index unavailable for {output_dir}, reading registries: {e}")
+        if page is not None:
+            total, rows, _last_sequence = page
+            # Index rows come from our own registries, so skip per-field validation
+            return FrameListResponse(
+                frames=[
+                    FrameSummary.model_construct(
+                        id=row["frame_id"],
+                        frame_id=row["frame_id"],
+                        sequence_index=row["sequence_index"],
+                        svo2_frame_index=(
+                            row["svo2_frame_index"]
+                            if row["svo2_frame_index"] is not None
+                            else row["sequence_index"]
+                        ),
+                        svo2_file=row["svo2_file"],
+                        timestamp_ns=row["timestamp_ns"],
+                        has_left_image=bool(row["has_left"]),
+                        has_right_image=bool(row["has_right"]),
+                        has_depth=bool(row["has_depth"]),
+                        has_pointcloud=bool(row["has_pointcloud"]),
+                        detection_count=row["detection_count"],
+                        thumbnail_url=f"/api/data/jobs/{job_id}/frames/{row['frame_id']}/image/left" if row["has_left"] else None,
+                    )
+                    for row in rows
+                ],
+                total=total,
+                limit=limit,
+                offset=offset,
+                job_id=str(job_id),
+            )
 
-            # Only process frames in the requested range
-            # We need to iterate through all to handle sorting by sequence_index
-            frame_id = frame.get("frame_id", "")
+        registries = await self._load_registries(output_dir)
 
-            frames_collected.append((seq_idx, FrameSummary(
+        # Get total count (lightweight - just counts from registry metadata)
+        total = sum(len(registry.get("frames", [])) for _, registry in registries)
+
+        # Select the requested page by sequence index with a bounded heap
+        # (stable, so equivalent to sorting everything and slicing)
+        page = heapq.nsmallest(
+            offset + limit,
+            self._iter_frames_from_registry(registries),
+            key=lambda item: item[0].get("sequence_index", 0),
+        )[offset:]
+
+        paginated: list[FrameSummary] = []
+        for frame, svo2_file, _seq_dir in page:
+            get = frame.get
+            seq_idx = get("sequence_index", 0)
+            frame_id = get("frame_id", "")
+            image_left = get("image_left")
+
+            paginated.append(FrameSummary.model_construct(
                 id=frame_id,
                 frame_id=frame_id,
                 sequence_index=seq_idx,
-                svo2_frame_index=frame.get("svo2_frame_index", seq_idx),
+                svo2_frame_index=get("svo2_frame_index", seq_idx),
                 svo2_file=svo2_file,
-                timestamp_ns=frame.get("timestamp_ns"),
-                has_left_image=bool(frame.get("image_left")),
-                has_right_image=bool(frame.get("image_right")),
-                has_depth=bool(frame.get("depth")),
-                has_pointcloud=bool(frame.get("point_cloud")),
-                detection_count=frame.get("detection_count", 0),
-                thumbnail_url=f"/api/data/jobs/{job_id}/frames/{frame_id}/image/left" if frame.get("image_left") else None,
-            )))
-
-            current_index += 1
-
-        # Sort by sequence index and apply pagination
-        frames_collected.sort(key=lambda x: x[0])
-        paginated = [f for _, f in frames_collected[offset:offset + limit]]
+                timestamp_ns=get("timestamp_ns"),
+                has_left_image=bool(image_left),
+                has_right_image=bool(get("image_right")),
+                has_depth=bool(get("depth")),
+                has_pointcloud=bool(get("point_cloud")),
+                detection_count=get("detection_count", 0),
+                thumbnail_url=f"/api/data/jobs/{job_id}/frames/{frame_id}/image/left" if image_left else None,
+            ))
 
         return FrameListResponse(
             frames=paginated,
@@ -288,55 +630,37 @@ class DataService:
         if not output_dir.exists():
             return None
 
-        # Search for the frame in all sequences
-        for seq_dir in output_dir.iterdir():
-            if not seq_dir.is_dir():
-                continue
+        indexed = await asyncio.to_thread(find_frame, output_dir, frame_id)
+        if indexed is None:
+            return None
 
-            registry_file = seq_dir / "frame_registry.json"
-            if not registry_file.exists():
-                continue
+        seq_dir, svo2_file, frame = indexed
+        seq_idx = frame.get("sequence_index", 0)
+        base_url = f"/api/data/jobs/{job_id}/frames/{frame_id}"
 
-            try:
-                with open(registry_file) as f:
-                    registry = json.load(f)
-
-                svo2_file = registry.get("svo2_file", seq_dir.name)
-
-                for frame in registry.get("frames", []):
-                    if frame.get("frame_id") == frame_id:
-                        # Found the frame
-                        seq_idx = frame.get("sequence_index", 0)
-                        base_url = f"/api/data/jobs/{job_id}/frames/{frame_id}"
-
-                        # Load annotations
-                        annotations = self._load_frame_annotations(
-                            seq_dir, frame_id, str(job_id)
-                        )
-
-                        return FrameDetail(
-                            id=frame_id,
-                            frame_id=frame_id,
-                            sequence_index=seq_idx,
-                            svo2_frame_index=frame.get("svo2_frame_index", seq_idx),
-                            svo2_file=svo2_file,
-                            timestamp_ns=frame.get("timestamp_ns"),
-                            image_left_url=f"{base_url}/image/left" if frame.get("image_left") else None,
-                            image_right_url=f"{base_url}/image/right" if frame.get("image_right") else None,
-                            depth_url=f"{base_url}/image/depth" if frame.get("depth") else None,
-                            pointcloud_url=f"{base_url}/pointcloud" if frame.get("point_cloud") else None,
-                            segmentation_complete=frame.get("segmentation_complete", False),
-                            reconstruction_complete=frame.get("reconstruction_complete", False),
-                            tracking_complete=frame.get("tracking_complete", False),
-                            annotations=annotations,
-                            metadata=self._load_frame_metadata(seq_dir, frame),
-                        )
-
-            except Exception as e:
-                logger.error(f"Error reading registry {registry_file}: {e}")
-                continue
+        # Load annotations and IMU metadata off the event loop
+        annotations, metadata = await asyncio.gather(
+            asyncio.to_thread(self._load_frame_annotations, seq_dir, frame_id, str(job_id)),
+            asyncio.to_thread(self._load_frame_metadata, seq_dir, frame),
+        )
 
-        return None
+        return FrameDetail(
+            id=frame_id,
+            frame_id=frame_id,
+            sequence_index=seq_idx,
+            svo2_frame_index=frame.get("svo2_frame_index", seq_idx),
+            svo2_file=svo2_file,
+            timestamp_ns=frame.get("timestamp_ns"),
+            image_left_url=f"{base_url}/image/left" if frame.get("image_left") else None,
+            image_right_url=f"{base_url}/image/right" if frame.get("image_right") else None,
+            depth_url=f"{base_url}/image/depth" if frame.get("depth") else None,
+            pointcloud_url=f"{base_url}/pointcloud" if frame.get("point_cloud") else None,
+            segmentation_complete=frame.get("segmentation_complete", False),
+            reconstruction_complete=frame.get("reconstruction_complete", False),
+            tracking_complete=frame.get("tracking_complete", False),
+            annotations=annotations,
+            metadata=metadata,
+        )
 
     def _load_frame_annotations(
         self,
@@ -347,35 +671,31 @@ class DataService:
         """Load annotations for a frame."""
         annotations: list[AnnotationSummary] = []
 
-        detections_file = seq_dir / "detections" / "detections.json"
-        if not detections_file.exists():
+        detections_dir = os.path.join(seq_dir, "detections")
+        detections_data = load_detections(os.path.join(detections_dir, "detections.json"))
+        if detections_data is None:
             return annotations
 
-        # Check if masks directory exists
-        masks_dir = seq_dir / "detections" / "masks"
-        masks_available = masks_dir.exists()
+        # Names of the mask files present for this sequence
+        mask_names = _list_mask_names(os.path.join(detections_dir, "masks"))
 
         try:
-            with open(detections_file) as f:
-                detections_data = json.load(f)
-
             frame_detections = detections_data.get("frames", {}).get(frame_id, {})
             for i, det in enumerate(frame_detections.get("detections", [])):
                 bbox = det.get("bbox", [0, 0, 0, 0])
 
                 # Check if mask file exists for this detection
                 mask_url = None
-                if masks_available:
-                    mask_file = masks_dir / f"{frame_id}_{i:03d}.png"
-                    if mask_file.exists():
-                        mask_url = f"/api/data/jobs/{job_id}/annotations/{frame_id}_{i}/mask"
+                if f"{frame_id}_{i:03d}.png" in mask_names:
+                    mask_url = f"/api/data/jobs/{job_id}/annotations/{frame_id}_{i}/mask"
 
-                annotations.append(AnnotationSummary(
+                # Detections are written by our own pipeline, so skip validation
+                annotations.append(AnnotationSummary.model_construct(
                     id=f"{frame_id}_{i}",
                     class_name=det.get("class_name", "unknown"),
-                    class_color=self._get_class_color(det.get("class_name", "")),
+                    class_color=_class_color(det.get("class_name", "")),
                     confidence=det.get("confidence", 0.0),
-                    bbox_2d=BBox2D(
+                    bbox_2d=BBox2D.model_construct(
                         # SAM3 outputs bbox as [x1, y1, x2, y2], convert to [x, y, width, height]
                         x=bbox[0] if len(bbox) > 0 else 0,
                         y=bbox[1] if len(bbox) > 1 else 0,
@@ -398,62 +718,42 @@ class DataService:
         frame: dict,
     ) -> FrameMetadataSummary | None:
         """Load frame metadata including IMU data."""
-        import math
-
         imu_path = frame.get("imu")
         if not imu_path:
             return None
 
-        imu_file = seq_dir / imu_path
-        if not imu_file.exists():
-            return None
-
         try:
-            with open(imu_file) as f:
-                values = f.read().strip().split()
-                if len(values) >= 20:
-                    # KITTI oxts format indices:
-                    # 3, 4, 5 = roll, pitch, yaw (radians)
-                    # 11, 12, 13 = ax, ay, az (m/s²)
-                    # 17, 18, 19 = wx, wy, wz (rad/s)
-                    roll_rad = float(values[3])
-                    pitch_rad = float(values[4])
-                    yaw_rad = float(values[5])
-
-                    return FrameMetadataSummary(
-                        accel_x=float(values[11]),
-                        accel_y=float(values[12]),
-                        accel_z=float(values[13]),
-                        gyro_x=float(values[17]),
-                        gyro_y=float(values[18]),
-                        gyro_z=float(values[19]),
-                        # Convert orientation from radians to degrees
-                        orientation_roll=math.degrees(roll_rad),
-                        orientation_pitch=math.degrees(pitch_rad),
-                        orientation_yaw=math.degrees(yaw_rad),
-                    )
+            with open(os.path.join(seq_dir, imu_path)) as f:
+                values = np.fromstring(f.read(), dtype=np.float64, sep=" ")
+            if values.size >= 20:
+                # KITTI oxts format indices:
+                # 3, 4, 5 = roll, pitch, yaw (radians)
+                # 11, 12, 13 = ax, ay, az (m/s²)
+                # 17, 18, 19 = wx, wy, wz (rad/s)
+                roll, pitch, yaw = np.degrees(values[3:6]).tolist()
+                accel_x, accel_y, accel_z = values[11:14].tolist()
+                gyro_x, gyro_y, gyro_z = values[17:20].tolist()
+
+                return FrameMetadataSummary(
+                    accel_x=accel_x,
+                    accel_y=accel_y,
+                    accel_z=accel_z,
+                    gyro_x=gyro_x,
+                    gyro_y=gyro_y,
+                    gyro_z=gyro_z,
+                    # Orientation converted from radians to degrees
+                    orientation_roll=roll,
+                    orientation_pitch=pitch,
+                    orientation_yaw=yaw,
+                )
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Error loading IMU data: {e}")
 
         return None
 
-    def _get_class_color(self, class_name: str) -> str:
-        """Get color for a class name."""
-        # Default colors for common classes
-        colors = {
-            "person": "#ef4444",
-            "pedestrian": "#ef4444",
-            "car": "#3b82f6",
-            "truck": "#8b5cf6",
-            "van": "#6366f1",
-            "cyclist": "#22c55e",
-            "motorcycle": "#f59e0b",
-            "traffic light": "#eab308",
-            "traffic sign": "#f97316",
-        }
-        return colors.get(class_name.lower(), "#6b7280")
-
-    def get_frame_file_path(
+    async def get_frame_file_path(
         self,
         job_id: UUID,
         frame_id: str,
@@ -464,39 +764,43 @@ class DataService:
         if not output_dir.exists():
             return None
 
-        # Search for the frame in all sequences
-        for seq_dir in output_dir.iterdir():
-            if not seq_dir.is_dir():
-                continue
+        indexed = await asyncio.to_thread(find_frame, output_dir, frame_id)
+        if indexed is None:
+            return None
 
-            registry_file = seq_dir / "frame_registry.json"
-            if not registry_file.exists():
-                continue
+        seq_dir, _svo2_file, frame = indexed
+        path_key = _FRAME_FILE_KEYS.get(file_type)
 
-            try:
-                with open(registry_file) as f:
-                    registry = json.load(f)
-
-                for frame in registry.get("frames", []):
-                    if frame.get("frame_id") == frame_id:
-                        # Found the frame - get the requested file
-                        path_key = {
-                            "left": "image_left",
-                            "right": "image_right",
-                            "depth": "depth",
-                            "pointcloud": "point_cloud",
-                        }.get(file_type)
-
-                        if path_key and frame.get(path_key):
-                            return seq_dir / frame[path_key]
-
-            except Exception as e:
-                logger.error(f"Error reading registry: {e}")
-                continue
+        if path_key and frame.get(path_key):
+            return seq_dir / frame[path_key]
 
         return None
 
-    def get_mask_file_path(
+    async def get_frame_file_paths(
+        self,
+        job_id: UUID,
+        frame_ids: list[str],
+        file_type: str,
+    ) -> dict[str, Path]:
+        """
+        Get existing file paths for many frames at once.
+
+        Resolves every frame and checks the files exist in a single worker
+        thread instead of one round trip per frame.
+
+        Returns:
+            Dict of frame_id -> path, for frames whose file exists
+        """
+        output_dir = OUTPUT_BASE / str(job_id)
+        path_key = _FRAME_FILE_KEYS.get(file_type)
+        if not path_key or not output_dir.exists():
+            return {}
+
+        return await asyncio.to_thread(
+            _resolve_frame_file_paths, output_dir, frame_ids, path_key
+        )
+
+    async def get_mask_file_path(
         self,
         job_id: UUID,
         annotation_id: str,
@@ -512,30 +816,20 @@ class DataService:
         if not output_dir.exists():
             return None
 
-        # Parse annotation_id to get frame_id and detection index
-        # Format: {frame_id}_{detection_index} where frame_id is like "abc123_000000"
-        # So annotation_id is like "abc123_000000_0" or "abc123_000000_12"
-        parts = annotation_id.rsplit("_", 1)
-        if len(parts) != 2:
+        parsed = _parse_annotation_id(annotation_id)
+        if parsed is None:
             return None
+        frame_id, det_idx = parsed
 
-        frame_id = parts[0]
-        try:
-            det_idx = int(parts[1])
-        except ValueError:
-            return None
+        # Masks live in the sequence directory of the frame's own registry
+        mask_name = f"{frame_id}_{det_idx:03d}.png"
+        indexed = await asyncio.to_thread(find_frame, output_dir, frame_id)
+        if indexed is not None:
+            mask_file = indexed[0] / "detections" / "masks" / mask_name
+            return mask_file if mask_file.exists() else None
 
-        # Search for the mask in all sequence directories
-        for seq_dir in output_dir.iterdir():
-            if not seq_dir.is_dir():
-                continue
-
-            # Mask files are stored as: detections/masks/{frame_id}_{idx:03d}.png
-            mask_file = seq_dir / "detections" / "masks" / f"{frame_id}_{det_idx:03d}.png"
-            if mask_file.exists():
-                return mask_file
-
-        return None
+        # Frame not in any registry: search for the mask in all sequence directories
+        return await asyncio.to_thread(_find_mask_file, output_dir, mask_name)
 
     async def get_correlation_table(
         self,
@@ -548,46 +842,66 @@ class DataService:
         if not output_dir.exists():
             return None
 
-        entries: list[CorrelationEntry] = []
-        svo2_file = ""
-        frame_skip = 1
-
-        for seq_dir in output_dir.iterdir():
-            if not seq_dir.is_dir():
-                continue
-
-            registry_file = seq_dir / "frame_registry.json"
-            if not registry_file.exists():
-                continue
+        page = None
+        try:
+            page = await asyncio.to_thread(query_frame_page, output_dir, limit, offset)
+        except sqlite3.Error as e:
+            logger.warning(f"Frame index unavailable for {output_dir}, reading registries: {e}")
+        if page is not None:
+            total, rows, last_sequence = page
+            return CorrelationTableResponse(
+                entries=[
+                    CorrelationEntry.model_construct(
+                        sequence_index=row["sequence_index"],
+                        svo2_frame_index=(
+                            row["svo2_frame_index"] if row["svo2_frame_index"] is not None else 0
+                        ),
+                        frame_id=row["frame_id"],
+                        has_left_image=bool(row["has_left"]),
+                        has_right_image=bool(row["has_right"]),
+                        has_depth=bool(row["has_depth"]),
+                        has_pointcloud=bool(row["has_pointcloud"]),
+                        has_imu=bool(row["has_imu"]),
+                        detection_count=row["detection_count"],
+                    )
+                    for row in rows
+                ],
+                total=total,
+                svo2_file=last_sequence["svo2_file"] if last_sequence else "",
+                frame_skip=last_sequence["frame_skip"] if last_sequence else 1,
+            )
 
-            try:
-                with open(registry_file) as f:
-                    registry = json.load(f)
-
-                svo2_file = registry.get("svo2_file", seq_dir.name)
-                frame_skip = registry.get("config", {}).get("frame_skip", 1)
-
-                for frame in registry.get("frames", []):
-                    entries.append(CorrelationEntry(
-                        sequence_index=frame.get("sequence_index", 0),
-                        svo2_frame_index=frame.get("svo2_frame_index", 0),
-                        frame_id=frame.get("frame_id", ""),
-                        has_left_image=bool(frame.get("image_left")),
-                        has_right_image=bool(frame.get("image_right")),
-                        has_depth=bool(frame.get("depth")),
-                        has_pointcloud=bool(frame.get("point_cloud")),
-                        has_imu=bool(frame.get("imu")),
-                        detection_count=frame.get("detection_count", 0),
-                    ))
-
-            except Exception as e:
-                logger.error(f"Error reading registry: {e}")
-                continue
+        registries = await self._load_registries(output_dir)
 
-        # Sort and paginate
-        entries.sort(key=lambda e: e.sequence_index)
-        total = len(entries)
-        entries = entries[offset:offset + limit]
+        svo2_file = ""
+        frame_skip = 1
+        if registries:
+            seq_dir, registry = registries[-1]
+            svo2_file = registry.get("svo2_file", seq_dir.name)
+            frame_skip = registry.get("config", {}).get("frame_skip", 1)
+
+        # Paginate by sequence index with a bounded heap
+        total = sum(len(registry.get("frames", [])) for _, registry in registries)
+        page = heapq.nsmallest(
+            offset + limit,
+            (frame for _, registry in registries for frame in registry.get("frames", [])),
+            key=lambda frame: frame.get("sequence_index", 0),
+        )[offset:]
+
+        entries = []
+        for frame in page:
+            get = frame.get
+            entries.append(CorrelationEntry.model_construct(
+                sequence_index=get("sequence_index", 0),
+                svo2_frame_index=get("svo2_frame_index", 0),
+                frame_id=get("frame_id", ""),
+                has_left_image=bool(get("image_left")),
+                has_right_image=bool(get("image_right")),
+                has_depth=bool(get("depth")),
+                has_pointcloud=bool(get("point_cloud")),
+                has_imu=bool(get("imu")),
+                detection_count=get("detection_count", 0),
+            ))
 
         return CorrelationTableResponse(
             entries=entries,
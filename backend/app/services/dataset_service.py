@@ -1,19 +1,24 @@
 """Dataset management service."""
 
+import asyncio
+import errno
 import hashlib
 import logging
 import os
 import shutil
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
 
+from backend.app.constants import STAGE_NAMES
 from backend.app.models.dataset import Dataset, DatasetFile
-from backend.app.models.job import ProcessingJob
+from backend.app.models.job import JobConfig, ProcessingJob
 from backend.app.schemas.dataset import (
     CameraInfo,
     DatasetCamerasResponse,
@@ -34,6 +39,136 @@ logger = logging.getLogger(__name__)
 # Base output directory for datasets
 OUTPUT_BASE = Path(os.getenv("PIPELINE_OUTPUT_DIR", "data/output"))
 
+# Number of leading bytes hashed to fingerprint an SVO2 file
+HEADER_HASH_BYTES = 65536
+
+# Most recent jobs listed per dataset in JobStats.jobs
+MAX_JOB_SUMMARIES_PER_DATASET = 20
+
+# Maximum number of cached DatasetResponse objects
+RESPONSE_CACHE_SIZE = 1024
+
+# SVO2 files opened at once for metadata extraction; each open starts a ZED
+# camera session with neural depth, so keep this small
+METADATA_EXTRACTION_CONCURRENCY = 2
+
+# copy_file_range failures that mean "use a regular copy instead"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
+
+
+_thread_local = threading.local()
+
+
+def _header_buffer() -> memoryview:
+    """Get this thread's reusable buffer for SVO2 header reads."""
+    buffer = getattr(_thread_local, "header_buffer", None)
+    if buffer is None:
+        buffer = memoryview(bytearray(HEADER_HASH_BYTES))
+        _thread_local.header_buffer = buffer
+    return buffer
+
+
+def _iter_svo2_files(
+    root: Path, recursive: bool, errors: list[str]
+) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Yield (path, stat) for SVO2 files under a folder.
+
+    Walks with os.scandir so non-SVO2 entries are filtered by name without
+    building Path objects, and the stat result comes from the DirEntry.
+    Symlinked directories are not followed. Unreadable directories and files
+    are recorded in errors and skipped.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError as e:
+        logger.warning(f"Skipping unreadable directory {root}: {e}")
+        errors.append(f"Error scanning {root}: {str(e)}")
+        return
+
+    with it:
+        for entry in it:
+            try:
+                if entry.name.endswith(".svo2") and entry.is_file():
+                    file_stat = entry.stat()
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    file_stat = None
+                else:
+                    continue
+            except OSError as e:
+                logger.warning(f"Skipping unreadable entry {entry.path}: {e}")
+                errors.append(f"Error scanning {entry.path}: {str(e)}")
+                continue
+
+            if file_stat is not None:
+                yield Path(entry.path), file_stat
+            else:
+                yield from _iter_svo2_files(Path(entry.path), recursive, errors)
+
+
+def copy_file_data(source_path: Path, dest_path: Path) -> None:
+    """
+    Copy a file and its metadata, letting the kernel move the bytes.
+
+    Uses copy_file_range so same-filesystem copies can be served in-kernel
+    (or reflinked on XFS/Btrfs), falling back to shutil.copy2 where the
+    syscall is unavailable or unsupported for the pair of files.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(source_path, dest_path)
+        return
+
+    try:
+        with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        if e.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+        shutil.copy2(source_path, dest_path)
+        return
+
+    shutil.copystat(source_path, dest_path)
+
+
+# Columns read by DatasetService._to_response
+_DATASET_RESPONSE_COLUMNS = (
+    Dataset.id,
+    Dataset.name,
+    Dataset.description,
+    Dataset.customer,
+    Dataset.site,
+    Dataset.equipment,
+    Dataset.collection_date,
+    Dataset.object_types,
+    Dataset.source_folder,
+    Dataset.output_directory,
+    Dataset.status,
+    Dataset.total_files,
+    Dataset.total_size_bytes,
+    Dataset.prepared_files,
+    Dataset.error_message,
+    Dataset.created_at,
+    Dataset.updated_at,
+)
+
+# (dataset id, updated_at) -> DatasetResponse without job stats
+_response_cache: OrderedDict[tuple[UUID, datetime], DatasetResponse] = OrderedDict()
+
+
+def _invalidate_response_cache(dataset_id: UUID) -> None:
+    """Drop cached responses for a dataset."""
+    for key in [key for key in _response_cache if key[0] == dataset_id]:
+        del _response_cache[key]
+
 
 class DatasetService:
     """Service for managing datasets and their files."""
@@ -56,23 +191,42 @@ class DatasetService:
             status="created",
         )
         self.db.add(dataset)
+        # The INSERT fetches server defaults (created_at, updated_at) via
+        # RETURNING and the session does not expire on commit, so no refresh
         await self.db.commit()
-        await self.db.refresh(dataset)
 
         logger.info(f"Created dataset {dataset.id}: {dataset.name}")
         return self._to_response(dataset)
 
-    async def get_dataset(self, dataset_id: UUID) -> DatasetDetailResponse | None:
-        """Get dataset by ID with files."""
+    async def get_dataset(
+        self, dataset_id: UUID, files_limit: int | None = None
+    ) -> DatasetDetailResponse | None:
+        """
+        Get dataset by ID with files.
+
+        Args:
+            dataset_id: Dataset UUID
+            files_limit: Maximum number of files to include (None for all)
+        """
         result = await self.db.execute(
-            select(Dataset)
-            .options(selectinload(Dataset.files))
-            .where(Dataset.id == dataset_id)
+            select(Dataset).where(Dataset.id == dataset_id)
         )
         dataset = result.scalar_one_or_none()
         if dataset is None:
             return None
 
+        # Load files separately so callers can cap the listing
+        files: list[DatasetFile] = []
+        if files_limit != 0:
+            files_query = (
+                select(DatasetFile)
+                .where(DatasetFile.dataset_id == dataset_id)
+                .order_by(DatasetFile.discovered_at.desc())
+                .limit(files_limit)
+            )
+            files_result = await self.db.execute(files_query)
+            files = list(files_result.scalars().all())
+
         # Count linked jobs
         job_count_result = await self.db.execute(
             select(func.count(ProcessingJob.id))
@@ -80,7 +234,7 @@ class DatasetService:
         )
         job_count = job_count_result.scalar() or 0
 
-        return self._to_detail_response(dataset, job_count)
+        return self._to_detail_response(dataset, files, job_count)
 
     async def _get_job_stats_for_datasets(
         self, dataset_ids: list[UUID]
@@ -89,44 +243,83 @@ class DatasetService:
         if not dataset_ids:
             return {}
 
-        # Query all jobs for these datasets (with config for object classes)
-        result = await self.db.execute(
-            select(ProcessingJob)
-            .options(joinedload(ProcessingJob.config))
-            .where(ProcessingJob.dataset_id.in_(dataset_ids))
-            .order_by(ProcessingJob.created_at.desc())
-        )
-        jobs = result.unique().scalars().all()
-
         # Group jobs by dataset_id
         stats_by_dataset: dict[UUID, JobStats] = {
             did: JobStats() for did in dataset_ids
         }
 
-        for job in jobs:
-            if job.dataset_id is None:
+        # Count jobs per dataset and status in the database
+        count_result = await self.db.execute(
+            select(
+                ProcessingJob.dataset_id,
+                ProcessingJob.status,
+                func.count().label("count"),
+            )
+            .where(ProcessingJob.dataset_id.in_(dataset_ids))
+            .group_by(ProcessingJob.dataset_id, ProcessingJob.status)
+        )
+        for dataset_id, status, count in count_result.all():
+            stats = stats_by_dataset.get(dataset_id)
+            if stats is None:
                 continue
 
+            stats.total += count
+            if status == "pending":
+                stats.pending += count
+            elif status == "running":
+                stats.running += count
+            elif status == "completed":
+                stats.completed += count
+            elif status == "failed":
+                stats.failed += count
+
+        # Rank jobs within each dataset so only the most recent ones are loaded
+        ranked = (
+            select(
+                ProcessingJob.id,
+                func.row_number()
+                .over(
+                    partition_by=ProcessingJob.dataset_id,
+                    order_by=ProcessingJob.created_at.desc(),
+                )
+                .label("rn"),
+            )
+            .where(ProcessingJob.dataset_id.in_(dataset_ids))
+            .subquery()
+        )
+
+        # Query only the columns needed for the summary list (plus config object classes)
+        result = await self.db.execute(
+            select(
+                ProcessingJob.id,
+                ProcessingJob.dataset_id,
+                ProcessingJob.name,
+                ProcessingJob.status,
+                ProcessingJob.progress,
+                ProcessingJob.current_stage,
+                ProcessingJob.total_frames,
+                ProcessingJob.processed_frames,
+                ProcessingJob.created_at,
+                ProcessingJob.completed_at,
+                ProcessingJob.error_message,
+                JobConfig.object_class_ids,
+            )
+            .join(ranked, ranked.c.id == ProcessingJob.id)
+            .outerjoin(ProcessingJob.config)
+            .where(ranked.c.rn <= MAX_JOB_SUMMARIES_PER_DATASET)
+            .order_by(ProcessingJob.created_at.desc())
+        )
+
+        for job in result.all():
             stats = stats_by_dataset.get(job.dataset_id)
             if stats is None:
                 continue
 
-            # Update counts
-            stats.total += 1
-            if job.status == "pending":
-                stats.pending += 1
-            elif job.status == "running":
-                stats.running += 1
-            elif job.status == "completed":
-                stats.completed += 1
-            elif job.status == "failed":
-                stats.failed += 1
-
             # Add job summary
             # Get object class IDs from config (UUIDs stored as strings)
             object_class_ids = []
-            if job.config and job.config.object_class_ids:
-                object_class_ids = [str(oid) for oid in job.config.object_class_ids]
+            if job.object_class_ids:
+                object_class_ids = [str(oid) for oid in job.object_class_ids]
 
             stats.jobs.append(
                 JobSummary(
@@ -134,7 +327,7 @@ class DatasetService:
                     name=job.name,
                     status=job.status,
                     progress=job.progress,
-                    current_stage_name=job.current_stage_name,
+                    current_stage_name=STAGE_NAMES.get(job.current_stage),
                     total_frames=job.total_frames,
                     processed_frames=job.processed_frames,
                     object_classes=object_class_ids,
@@ -155,26 +348,35 @@ class DatasetService:
         status: str | None = None,
     ) -> tuple[list[DatasetResponse], int]:
         """List datasets with optional filtering."""
-        query = select(Dataset)
-        count_query = select(func.count(Dataset.id))
-
+        filters = []
         if customer:
-            query = query.where(Dataset.customer == customer)
-            count_query = count_query.where(Dataset.customer == customer)
+            filters.append(Dataset.customer == customer)
         if site:
-            query = query.where(Dataset.site == site)
-            count_query = count_query.where(Dataset.site == site)
+            filters.append(Dataset.site == site)
         if status:
-            query = query.where(Dataset.status == status)
-            count_query = count_query.where(Dataset.status == status)
-
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        query = query.order_by(Dataset.created_at.desc())
-        query = query.offset(offset).limit(limit)
+            filters.append(Dataset.status == status)
+
+        # Rows and total count in a single round trip, fetching only response columns
+        query = (
+            select(*_DATASET_RESPONSE_COLUMNS, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(Dataset.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
         result = await self.db.execute(query)
-        datasets = result.scalars().all()
+        datasets = result.all()
+
+        if datasets:
+            total = datasets[0].total
+        elif offset > 0:
+            # Page past the end: the window count has no row to ride on
+            count_result = await self.db.execute(
+                select(func.count(Dataset.id)).where(*filters)
+            )
+            total = count_result.scalar() or 0
+        else:
+            total = 0
 
         # Fetch job stats for all datasets in one query
         dataset_ids = [d.id for d in datasets]
@@ -190,57 +392,51 @@ class DatasetService:
         self, dataset_id: UUID, data: DatasetUpdate
     ) -> DatasetResponse | None:
         """Update dataset metadata."""
-        result = await self.db.execute(
-            select(Dataset).where(Dataset.id == dataset_id)
-        )
-        dataset = result.scalar_one_or_none()
-        if dataset is None:
-            return None
-
         # Update fields that were provided
-        if data.name is not None:
-            dataset.name = data.name
-        if data.description is not None:
-            dataset.description = data.description
-        if data.customer is not None:
-            dataset.customer = data.customer
-        if data.site is not None:
-            dataset.site = data.site
-        if data.equipment is not None:
-            dataset.equipment = data.equipment
-        if data.collection_date is not None:
-            dataset.collection_date = data.collection_date
-        if data.object_types is not None:
-            dataset.object_types = data.object_types
-        if data.source_folder is not None:
-            dataset.source_folder = data.source_folder
+        values = {
+            field: value
+            for field, value in data.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        if "source_folder" in values:
             # Reset error when source folder is changed
-            dataset.error_message = None
-        if data.output_directory is not None:
-            dataset.output_directory = data.output_directory
-        if data.status is not None:
-            dataset.status = data.status
+            values["error_message"] = None
+        if values.get("status") == "created":
             # Clear error message when status is reset
-            if data.status == "created":
-                dataset.error_message = None
+            values["error_message"] = None
+
+        if values:
+            result = await self.db.execute(
+                update(Dataset)
+                .where(Dataset.id == dataset_id)
+                .values(**values)
+                .returning(*_DATASET_RESPONSE_COLUMNS)
+            )
+        else:
+            result = await self.db.execute(
+                select(*_DATASET_RESPONSE_COLUMNS).where(Dataset.id == dataset_id)
+            )
+        dataset = result.one_or_none()
+        if dataset is None:
+            return None
 
         await self.db.commit()
-        await self.db.refresh(dataset)
+        _invalidate_response_cache(dataset_id)
 
         logger.info(f"Updated dataset {dataset_id}")
         return self._to_response(dataset)
 
     async def delete_dataset(self, dataset_id: UUID) -> bool:
         """Delete a dataset and its files."""
+        # Files, lineage and job links are handled by the foreign key ON DELETE rules
         result = await self.db.execute(
-            select(Dataset).where(Dataset.id == dataset_id)
+            delete(Dataset).where(Dataset.id == dataset_id)
         )
-        dataset = result.scalar_one_or_none()
-        if dataset is None:
+        if result.rowcount == 0:
             return False
 
-        await self.db.delete(dataset)
         await self.db.commit()
+        _invalidate_response_cache(dataset_id)
 
         logger.info(f"Deleted dataset {dataset_id}")
         return True
@@ -276,67 +472,92 @@ class DatasetService:
         duplicates_skipped = 0
         total_size = 0
         errors: list[str] = []
+        rows_to_insert: list[dict] = []
+        new_paths: list[Path] = []
+
+        # Fetch existing paths once instead of querying per file
+        existing_result = await self.db.execute(
+            select(DatasetFile.original_path).where(DatasetFile.dataset_id == dataset_id)
+        )
+        existing_paths = set(existing_result.scalars().all())
 
-        pattern = "**/*.svo2" if recursive else "*.svo2"
-        for svo2_path in source_path.glob(pattern):
+        for svo2_path, file_stat in _iter_svo2_files(source_path, recursive, errors):
             files_found += 1
 
             try:
                 # Check for duplicates by path
-                existing = await self.db.execute(
-                    select(DatasetFile).where(
-                        DatasetFile.dataset_id == dataset_id,
-                        DatasetFile.original_path == str(svo2_path),
-                    )
-                )
-                if existing.scalar_one_or_none() is not None:
+                original_path = str(svo2_path)
+                if original_path in existing_paths:
                     duplicates_skipped += 1
                     continue
 
                 # Get file info
-                file_stat = svo2_path.stat()
                 file_size = file_stat.st_size
                 total_size += file_size
 
                 # Calculate relative path
                 relative_path = str(svo2_path.relative_to(source_path))
 
-                # Create file record
-                dataset_file = DatasetFile(
-                    dataset_id=dataset_id,
-                    original_path=str(svo2_path),
-                    original_filename=svo2_path.name,
-                    relative_path=relative_path,
-                    file_size=file_size,
-                    status="discovered",
-                    discovered_at=datetime.now(timezone.utc),
-                )
-
-                # Extract metadata if requested
-                if extract_metadata:
-                    try:
-                        metadata = await self._extract_svo2_metadata(svo2_path)
-                        dataset_file.camera_id = metadata.get("camera_id")
-                        dataset_file.camera_model = metadata.get("camera_model")
-                        dataset_file.camera_serial = metadata.get("serial_number")
-                        dataset_file.firmware_version = metadata.get("firmware_version")
-                        dataset_file.frame_count = metadata.get("frame_count")
-                        dataset_file.resolution_width = metadata.get("resolution", {}).get("width")
-                        dataset_file.resolution_height = metadata.get("resolution", {}).get("height")
-                        dataset_file.fps = metadata.get("fps")
-                        dataset_file.file_hash = metadata.get("file_hash")
-                        dataset_file.metadata = metadata
-                    except Exception as e:
-                        logger.warning(f"Failed to extract metadata from {svo2_path}: {e}")
-                        errors.append(f"Metadata extraction failed for {svo2_path.name}: {str(e)}")
-
-                self.db.add(dataset_file)
+                # Build file record
+                file_row = {
+                    "dataset_id": dataset_id,
+                    "original_path": original_path,
+                    "original_filename": svo2_path.name,
+                    "relative_path": relative_path,
+                    "file_size": file_size,
+                    "status": "discovered",
+                    "discovered_at": datetime.now(timezone.utc),
+                }
+
+                rows_to_insert.append(file_row)
+                new_paths.append(svo2_path)
+                existing_paths.add(original_path)
                 files_added += 1
 
             except Exception as e:
                 logger.error(f"Error processing {svo2_path}: {e}")
                 errors.append(f"Error processing {svo2_path.name}: {str(e)}")
 
+        # Extract metadata for new files in worker threads, a few SDK sessions at a time
+        if extract_metadata and new_paths:
+            semaphore = asyncio.Semaphore(METADATA_EXTRACTION_CONCURRENCY)
+
+            async def extract(svo2_path: Path) -> dict:
+                async with semaphore:
+                    return await asyncio.to_thread(self._extract_svo2_metadata, svo2_path)
+
+            metadatas = await asyncio.gather(
+                *(extract(p) for p in new_paths),
+                return_exceptions=True,
+            )
+            for svo2_path, file_row, metadata in zip(
+                new_paths, rows_to_insert, metadatas, strict=True
+            ):
+                if isinstance(metadata, Exception):
+                    logger.warning(f"Failed to extract metadata from {svo2_path}: {metadata}")
+                    errors.append(
+                        f"Metadata extraction failed for {svo2_path.name}: {str(metadata)}"
+                    )
+                    continue
+
+                resolution = metadata.get("resolution", {})
+                file_row.update(
+                    camera_id=metadata.get("camera_id"),
+                    camera_model=metadata.get("camera_model"),
+                    camera_serial=metadata.get("serial_number"),
+                    firmware_version=metadata.get("firmware_version"),
+                    frame_count=metadata.get("frame_count"),
+                    resolution_width=resolution.get("width"),
+                    resolution_height=resolution.get("height"),
+                    fps=metadata.get("fps"),
+                    file_hash=metadata.get("file_hash"),
+                    extra_metadata=metadata,
+                )
+
+        # Insert all new file records in a single executemany
+        if rows_to_insert:
+            await self.db.execute(insert(DatasetFile), rows_to_insert)
+
         # Update dataset statistics
         dataset.total_files = files_found - duplicates_skipped
         dataset.total_size_bytes = total_size
@@ -357,7 +578,7 @@ class DatasetService:
             errors=errors,
         )
 
-    async def _extract_svo2_metadata(self, svo2_path: Path) -> dict:
+    def _extract_svo2_metadata(self, svo2_path: Path) -> dict:
         """Extract metadata from SVO2 file using ZED SDK."""
         try:
             from processing.svo2.reader import SVO2Reader
@@ -395,10 +616,14 @@ class DatasetService:
 
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of first 64KB of file."""
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            hasher.update(f.read(65536))
-        return hasher.hexdigest()[:16]
+        # A single positional read on a raw fd into this thread's reusable buffer
+        buffer = _header_buffer()
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            n = os.preadv(fd, [buffer], 0)
+        finally:
+            os.close(fd)
+        return hashlib.sha256(buffer[:n]).hexdigest()[:16]
 
     async def prepare_files(
         self,
@@ -407,9 +632,7 @@ class DatasetService:
     ) -> DatasetPrepareResponse:
         """Prepare (copy and rename) dataset files."""
         result = await self.db.execute(
-            select(Dataset)
-            .options(selectinload(Dataset.files))
-            .where(Dataset.id == dataset_id)
+            select(Dataset).where(Dataset.id == dataset_id)
         )
         dataset = result.scalar_one_or_none()
         if dataset is None:
@@ -430,9 +653,13 @@ class DatasetService:
         await self.db.commit()
 
         # Count files to prepare
-        files_to_prepare = sum(
-            1 for f in dataset.files if f.status == "discovered"
+        count_result = await self.db.execute(
+            select(func.count(DatasetFile.id)).where(
+                DatasetFile.dataset_id == dataset_id,
+                DatasetFile.status == "discovered",
+            )
         )
+        files_to_prepare = count_result.scalar_one()
 
         logger.info(
             f"Preparing dataset {dataset_id}: {files_to_prepare} files to {output_dir}"
@@ -467,30 +694,14 @@ class DatasetService:
 
         dataset_file, dataset = row[0], row[1]
 
-        # Update status
-        dataset_file.status = "copying"
-        await self.db.commit()
+        # Only the final state is committed; "copying" is not persisted
+        logger.debug(f"Copying file {file_id}: {dataset_file.original_filename}")
 
         try:
-            source_path = Path(dataset_file.original_path)
-            if not source_path.exists():
-                raise FileNotFoundError(f"Source file not found: {source_path}")
-
-            # Generate new filename with naming convention
-            timestamp = int(datetime.now(timezone.utc).timestamp())
-            camera_id = dataset_file.camera_id or "unknown"
-            job_id_str = str(job_id)[:8] if job_id else str(dataset_id)[:8]
-
-            new_filename = f"{job_id_str}_{timestamp}_{camera_id}_{dataset_file.original_filename}"
-
-            # Create camera-specific subdirectory
-            output_dir = Path(dataset.output_directory) / camera_id
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            dest_path = output_dir / new_filename
-
-            # Copy the file
-            shutil.copy2(source_path, dest_path)
+            dest_path = await asyncio.to_thread(
+                self._copy_dataset_file, dataset_file, dataset, job_id
+            )
+            new_filename = dest_path.name
 
             # Update file record
             dataset_file.renamed_path = str(dest_path)
@@ -503,7 +714,9 @@ class DatasetService:
 
             await self.db.commit()
 
-            logger.info(f"Copied file {file_id}: {source_path.name} -> {new_filename}")
+            logger.info(
+                f"Copied file {file_id}: {dataset_file.original_filename} -> {new_filename}"
+            )
             return True
 
         except Exception as e:
@@ -514,6 +727,100 @@ class DatasetService:
             logger.error(f"Failed to copy file {file_id}: {e}")
             return False
 
+    async def copy_files_batch(
+        self,
+        file_ids: list[UUID],
+        job_id: UUID | None = None,
+    ) -> int:
+        """
+        Copy and rename several dataset files concurrently.
+
+        File rows are loaded with one query, copied in worker threads, and
+        updated with a single executemany UPDATE and one commit.
+
+        Returns:
+            Number of files copied successfully
+        """
+        result = await self.db.execute(
+            select(DatasetFile, Dataset)
+            .join(Dataset)
+            .where(DatasetFile.id.in_(file_ids))
+        )
+        rows = result.all()
+        if not rows:
+            return 0
+
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._copy_dataset_file, dataset_file, dataset, job_id)
+                for dataset_file, dataset in rows
+            ),
+            return_exceptions=True,
+        )
+
+        copied_at = datetime.now(timezone.utc)
+        file_updates: list[dict] = []
+        prepared_by_dataset: Counter[UUID] = Counter()
+        for (dataset_file, dataset), outcome in zip(rows, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to copy file {dataset_file.id}: {outcome}")
+                file_updates.append({
+                    "id": dataset_file.id,
+                    "status": "failed",
+                    "error_message": str(outcome),
+                })
+                continue
+
+            file_updates.append({
+                "id": dataset_file.id,
+                "status": "copied",
+                "renamed_path": str(outcome),
+                "renamed_filename": outcome.name,
+                "copied_at": copied_at,
+            })
+            prepared_by_dataset[dataset.id] += 1
+
+        await self.db.execute(update(DatasetFile), file_updates)
+        for dataset_id, count in prepared_by_dataset.items():
+            await self.db.execute(
+                update(Dataset)
+                .where(Dataset.id == dataset_id)
+                .values(prepared_files=Dataset.prepared_files + count)
+            )
+        await self.db.commit()
+
+        copied = sum(prepared_by_dataset.values())
+        logger.info(f"Copied {copied}/{len(rows)} dataset files in batch")
+        return copied
+
+    def _copy_dataset_file(
+        self,
+        dataset_file: DatasetFile,
+        dataset: Dataset,
+        job_id: UUID | None,
+    ) -> Path:
+        """Copy a dataset file to its renamed location and return the new path."""
+        source_path = Path(dataset_file.original_path)
+        if not source_path.exists():
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        # Generate new filename with naming convention
+        timestamp = int(datetime.now(timezone.utc).timestamp())
+        camera_id = dataset_file.camera_id or "unknown"
+        job_id_str = str(job_id)[:8] if job_id else str(dataset.id)[:8]
+
+        new_filename = f"{job_id_str}_{timestamp}_{camera_id}_{dataset_file.original_filename}"
+
+        # Create camera-specific subdirectory
+        output_dir = Path(dataset.output_directory) / camera_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        dest_path = output_dir / new_filename
+
+        # Copy the file
+        copy_file_data(source_path, dest_path)
+        return dest_path
+
     async def get_dataset_files(
         self,
         dataset_id: UUID,
@@ -579,10 +886,17 @@ class DatasetService:
         )
 
     def _to_response(
-        self, dataset: Dataset, job_stats: JobStats | None = None
+        self, dataset: Dataset | Row, job_stats: JobStats | None = None
     ) -> DatasetResponse:
-        """Convert dataset model to response schema."""
-        return DatasetResponse(
+        """Convert a dataset model (or a row of its response columns) to response schema."""
+        # updated_at changes on every write, so it keys out stale entries
+        cache_key = (dataset.id, dataset.updated_at)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            _response_cache.move_to_end(cache_key)
+            return cached.model_copy(update={"job_stats": job_stats or JobStats()})
+
+        response = DatasetResponse(
             id=dataset.id,
             name=dataset.name,
             description=dataset.description,
@@ -600,11 +914,16 @@ class DatasetService:
             error_message=dataset.error_message,
             created_at=dataset.created_at,
             updated_at=dataset.updated_at,
-            job_stats=job_stats or JobStats(),
+            job_stats=JobStats(),
         )
+        _response_cache[cache_key] = response
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+        return response.model_copy(update={"job_stats": job_stats or JobStats()})
 
     def _to_detail_response(
-        self, dataset: Dataset, job_count: int
+        self, dataset: Dataset, dataset_files: Sequence[DatasetFile], job_count: int
     ) -> DatasetDetailResponse:
         """Convert dataset model to detailed response schema."""
         files = [
@@ -625,7 +944,7 @@ class DatasetService:
                 status=f.status,
                 error_message=f.error_message,
             )
-            for f in dataset.files
+            for f in dataset_files
         ]
 
         return DatasetDetailResponse(
@@ -1,13 +1,15 @@
 """Frame diversity analysis service using perceptual hashing and motion estimation."""
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 
 import numpy as np
 from PIL import Image
-from scipy import ndimage
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,12 +17,20 @@ from backend.app.models import ProcessingJob
 from backend.app.models.training_dataset import FrameDiversityCache
 from backend.app.schemas.review import (
     DiversityAnalysisResponse,
+    DiversityFrameDetail,
+    DiversityFrameDetailsResponse,
     FrameCluster,
 )
 from backend.app.services.data_service import DataService
 
 logger = logging.getLogger(__name__)
 
+# Threads used to decode, hash and diff frames
+DIVERSITY_WORKERS = min(8, os.cpu_count() or 1)
+
+# Frames decoded per batch (bounds the number of decoded frames held in memory)
+DIVERSITY_WINDOW = 4 * DIVERSITY_WORKERS
+
 
 def compute_dhash(image: Image.Image, hash_size: int = 16) -> str:
     """
@@ -29,15 +39,22 @@ def compute_dhash(image: Image.Image, hash_size: int = 16) -> str:
     dHash is fast and effective for detecting near-duplicates.
     It compares adjacent pixels to generate a hash.
     """
-    # Resize to hash_size+1 x hash_size
-    resized = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
-    pixels = np.array(resized)
+    return compute_dhash_bytes(image, hash_size).hex()
+
+
+def compute_dhash_bytes(image: Image.Image, hash_size: int = 16) -> bytes:
+    """Compute the dHash of an image as raw bytes (see compute_dhash)."""
+    # Resize to hash_size+1 x hash_size. A box filter (plain area average) is
+    # enough for a 17x16 thumbnail and much cheaper than Lanczos on full frames.
+    gray = image if image.mode == "L" else image.convert("L")
+    resized = gray.resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+    pixels = np.asarray(resized)
 
     # Compute differences between adjacent pixels
     diff = pixels[:, 1:] > pixels[:, :-1]
 
-    # Convert to hex string
-    return "".join(format(byte, "02x") for byte in np.packbits(diff.flatten()))
+    # Pack to bytes
+    return np.packbits(diff.ravel()).tobytes()
 
 
 def compute_hash_similarity(hash1: str, hash2: str) -> float:
@@ -49,41 +66,188 @@ def compute_hash_similarity(hash1: str, hash2: str) -> float:
     if len(hash1) != len(hash2):
         return 0.0
 
-    # Convert hex to binary
-    bits1 = bin(int(hash1, 16))[2:].zfill(len(hash1) * 4)
-    bits2 = bin(int(hash2, 16))[2:].zfill(len(hash2) * 4)
-
-    # Count differing bits
-    diff_count = sum(b1 != b2 for b1, b2 in zip(bits1, bits2, strict=True))
+    # Count differing bits with a single popcount of the XOR
+    diff_count = (int(hash1, 16) ^ int(hash2, 16)).bit_count()
 
     # Return similarity (1 - normalized distance)
-    return 1.0 - (diff_count / len(bits1))
+    return 1.0 - (diff_count / (len(hash1) * 4))
+
+
+# Number of set bits in each byte value
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# Hardware popcount ufunc (NumPy >= 2.0), or None to use the lookup table
+_bitwise_count = getattr(np, "bitwise_count", None)
+
+
+def popcount_rows(words: np.ndarray) -> np.ndarray:
+    """Count set bits in each row of a 2D uint64 array."""
+    if _bitwise_count is not None:
+        return _bitwise_count(words).sum(axis=1)
+    return _POPCOUNT_TABLE[words.view(np.uint8)].sum(axis=1)
 
 
-def compute_motion_score(prev_path: Path, curr_path: Path) -> float:
+def pack_hashes(hash_bytes: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
     """
-    Compute motion score between two frames using frame differencing.
+    Pack hashes into one (n, words) uint64 matrix.
 
-    Returns value between 0 (no motion) and 1 (maximum motion).
+    Packed hashes are compared with XOR + popcount instead of re-parsing
+    them for every comparison. Shorter hashes are zero padded to the widest
+    one; missing hashes (b"") become all-zero rows.
+
+    Returns:
+        Tuple of (packed hash matrix, hash length in bits per row, 0 if missing)
     """
-    try:
-        prev = np.array(Image.open(prev_path).convert("L"), dtype=np.float32)
-        curr = np.array(Image.open(curr_path).convert("L"), dtype=np.float32)
+    nbits = np.array([len(h) * 8 for h in hash_bytes], dtype=np.int64)
+    width = -(-int(nbits.max(initial=0)) // 64) * 8  # bytes per padded row
+    raw = b"".join(h.ljust(width, b"\0") for h in hash_bytes)
+    return np.frombuffer(raw, dtype=np.uint64).reshape(len(hash_bytes), width // 8), nbits
+
+
+def pack_hash_blob(frame_ids: list[str], hashes: dict[str, bytes]) -> bytes:
+    """
+    Concatenate equal-length hashes into one blob, ordered by frame_ids.
+
+    This is the cache storage format: row k of the blob is frame_ids[k]'s hash.
+    """
+    return b"".join(hashes[fid] for fid in frame_ids)
 
-        # Compute absolute difference
-        diff = np.abs(prev - curr)
 
-        # Apply Gaussian blur to reduce noise
-        diff = ndimage.gaussian_filter(diff, sigma=2)
+def unpack_hash_blob(frame_ids: list[str], blob: bytes) -> dict[str, bytes]:
+    """Split a blob written by pack_hash_blob back into per-frame hashes."""
+    if not frame_ids:
+        return {}
+    width = len(blob) // len(frame_ids)
+    return {
+        fid: blob[k * width : (k + 1) * width] for k, fid in enumerate(frame_ids)
+    }
 
-        # Normalize to 0-1
-        motion_score = float(np.mean(diff) / 255.0)
+
+def assign_clusters(
+    hashes: np.ndarray,
+    hash_bits: np.ndarray,
+    low_motion: np.ndarray,
+    similarity_threshold: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Greedy diverse-frame assignment over packed hashes.
+
+    Frames are visited in order. Low-motion frames are dropped, a frame whose
+    hash is more similar than the threshold to an already selected frame of
+    the same hash length joins that frame's cluster, and any other frame is
+    selected.
+
+    Args:
+        hashes: (n, words) packed hashes from pack_hashes
+        hash_bits: Hash length in bits per frame, 0 for frames without a hash
+        low_motion: Per-frame mask of frames to drop for low motion
+        similarity_threshold: Frames with similarity > this are duplicates
+
+    Returns:
+        Tuple of (per-frame assignment, per-frame similarity). The assignment
+        is the frame's own index if selected, the index of the selected frame
+        it duplicates, or -1 if dropped for low motion. The similarity to that
+        selected frame is only set for duplicates.
+    """
+    n = len(hash_bits)
+    words = hashes.shape[1]
+    head = max(1, words // 2)
+    assignment = np.full(n, -1, dtype=np.int64)
+    similarity = np.zeros(n, dtype=np.float64)
+
+    # Hashes of selected frames, stacked for batched comparison
+    selected_hashes = np.empty_like(hashes)
+    selected_bits = np.empty(n, dtype=np.int64)
+    selected_index = np.empty(n, dtype=np.int64)
+    count = 0
+
+    for i in range(n):
+        if low_motion[i]:
+            continue
+
+        nbits = hash_bits[i]
+        if nbits == 0:
+            assignment[i] = i
+            continue
+
+        if count:
+            # Compare against every selected hash at once; only same-length
+            # hashes can match. The distance over the first half of the words
+            # is a lower bound, so selected hashes already over the distance
+            # budget are dropped before the rest of the words are compared.
+            # (The budget is rounded up; survivors get the exact check below.)
+            budget = int((1.0 - similarity_threshold) * nbits) + 1
+            distances = popcount_rows(
+                np.bitwise_xor(selected_hashes[:count, :head], hashes[i, :head])
+            )
+            candidates = np.flatnonzero(
+                (selected_bits[:count] == nbits) & (distances <= budget)
+            )
+            if candidates.size:
+                distances = distances[candidates]
+                if head < words:
+                    distances = distances + popcount_rows(
+                        np.bitwise_xor(
+                            selected_hashes[candidates, head:], hashes[i, head:]
+                        )
+                    )
+                sims = 1.0 - distances / nbits
+                matches = np.flatnonzero(sims > similarity_threshold)
+                if matches.size:
+                    assignment[i] = selected_index[candidates[matches[0]]]
+                    similarity[i] = sims[matches[0]]
+                    continue
+
+        assignment[i] = i
+        selected_hashes[count] = hashes[i]
+        selected_bits[count] = nbits
+        selected_index[count] = i
+        count += 1
+
+    return assignment, similarity
+
+
+def load_grayscale(path: Path) -> Image.Image:
+    """
+    Open an image as 8-bit grayscale.
+
+    For JPEG frames, draft mode makes libjpeg decode straight to grayscale
+    at full resolution instead of decoding RGB and converting afterwards.
+    Other formats are decoded and converted as usual.
+    """
+    img = Image.open(path)
+    img.draft("L", img.size)
+    return img.convert("L")
+
+
+def compute_motion_score(prev: np.ndarray, curr: np.ndarray) -> float:
+    """
+    Compute motion score between two grayscale frames using frame differencing.
+
+    Returns value between 0 (no motion) and 1 (maximum motion).
+    """
+    try:
+        # Mean absolute difference, normalized to 0-1. (A Gaussian blur before
+        # the mean would not change it: the reflect-mode kernel preserves the sum.)
+        # max - min is |prev - curr| without widening the uint8 frames.
+        diff = np.maximum(prev, curr)
+        diff -= np.minimum(prev, curr)
+        motion_score = float(diff.sum(dtype=np.uint64) / diff.size / 255.0)
         return motion_score
     except Exception as e:
         logger.warning(f"Error computing motion score: {e}")
         return 0.0
 
 
+def _decode_frame(image_path: Path) -> tuple[bytes, np.ndarray] | Exception:
+    """Decode a frame to grayscale and hash it; errors are returned, not raised."""
+    try:
+        img = load_grayscale(image_path)
+        return compute_dhash_bytes(img), np.asarray(img)
+    except Exception as e:
+        return e
+
+
 class DiversityService:
     """Service for frame diversity analysis."""
 
@@ -105,6 +269,7 @@ class DiversityService:
         motion_threshold: float = 0.02,
         camera: str = "left",
         use_cache: bool = True,
+        include_details: bool = False,
     ) -> DiversityAnalysisResponse:
         """
         Analyze frame diversity using perceptual hashing and motion estimation.
@@ -115,6 +280,7 @@ class DiversityService:
             motion_threshold: Frames with motion < this are low-motion (0-1)
             camera: Which camera to analyze ("left" or "right")
             use_cache: Whether to use cached hash/motion data
+            include_details: Whether to include per-frame hashes and motion scores
 
         Returns:
             DiversityAnalysisResponse with selected/excluded frames and clusters
@@ -128,12 +294,12 @@ class DiversityService:
             raise ValueError(f"Job {job_id} not found")
 
         # Check for cached data
-        cache = await self.get_cached_analysis(job_id) if use_cache else None
-        perceptual_hashes: dict[str, str] = {}
+        cache = await self.get_cached_analysis(job_id)
+        perceptual_hashes: dict[str, bytes] = {}
         motion_scores: dict[str, float] = {}
 
-        if cache and cache.status == "complete":
-            perceptual_hashes = cache.perceptual_hashes
+        if use_cache and cache and cache.status == "complete":
+            perceptual_hashes = unpack_hash_blob(cache.frame_ids, cache.perceptual_hashes)
             motion_scores = cache.motion_scores
         else:
             # Need to compute from scratch
@@ -143,15 +309,16 @@ class DiversityService:
 
             # Save to cache
             await self._save_to_cache(
-                job_id, camera, perceptual_hashes, motion_scores
+                job_id, cache, camera, perceptual_hashes, motion_scores
             )
 
         # Get frame order
         frames_list = await self.data_service.list_frames(str(job_id), limit=10000)
         frame_ids = [f.frame_id for f in frames_list.frames]
 
-        # Run selection algorithm
-        selected, excluded, clusters = self._select_diverse_frames(
+        # Run selection algorithm (CPU bound, kept off the event loop)
+        selected, excluded, clusters, low_motion_count = await asyncio.to_thread(
+            self._select_diverse_frames,
             frame_ids,
             perceptual_hashes,
             motion_scores,
@@ -159,18 +326,11 @@ class DiversityService:
             motion_threshold,
         )
 
-        # Count low motion frames
-        low_motion_count = sum(
-            1
-            for i, fid in enumerate(frame_ids)
-            if i > 0 and motion_scores.get(fid, 1.0) < motion_threshold
-        )
-
         reduction_pct = (
             (len(excluded) / len(frame_ids) * 100) if frame_ids else 0.0
         )
 
-        return DiversityAnalysisResponse(
+        response = DiversityAnalysisResponse(
             job_id=str(job_id),
             status="complete",
             selected_frame_indices=selected,
@@ -181,63 +341,151 @@ class DiversityService:
             reduction_percent=round(reduction_pct, 1),
             duplicate_pairs_found=len(clusters),
             low_motion_frames=low_motion_count,
-            perceptual_hashes={i: perceptual_hashes.get(fid, "") for i, fid in enumerate(frame_ids)},
-            motion_scores={i: motion_scores.get(fid, 0.0) for i, fid in enumerate(frame_ids)},
+        )
+
+        # Per-frame data is only built when requested
+        if include_details:
+            response.perceptual_hashes = {
+                i: perceptual_hashes.get(fid, b"").hex() for i, fid in enumerate(frame_ids)
+            }
+            response.motion_scores = {
+                i: motion_scores.get(fid, 0.0) for i, fid in enumerate(frame_ids)
+            }
+
+        return response
+
+    async def get_frame_details(
+        self, job_id: UUID, offset: int = 0, limit: int = 500
+    ) -> DiversityFrameDetailsResponse:
+        """
+        Get a page of cached per-frame hashes and motion scores.
+
+        Frame indices match the indices in DiversityAnalysisResponse.
+
+        Raises:
+            ValueError: If the job has no completed diversity analysis
+        """
+        cache = await self.get_cached_analysis(job_id)
+        if not cache or cache.status != "complete":
+            raise ValueError(f"No diversity analysis found for job {job_id}")
+
+        frames_page = await self.data_service.list_frames(
+            str(job_id), limit=limit, offset=offset
+        )
+        page_ids = [f.frame_id for f in frames_page.frames]
+
+        hashes = unpack_hash_blob(cache.frame_ids, cache.perceptual_hashes)
+        motion_scores = cache.motion_scores
+
+        return DiversityFrameDetailsResponse(
+            job_id=str(job_id),
+            frames=[
+                DiversityFrameDetail(
+                    frame_index=offset + i,
+                    frame_id=fid,
+                    perceptual_hash=hashes.get(fid, b"").hex(),
+                    motion_score=motion_scores.get(fid, 0.0),
+                )
+                for i, fid in enumerate(page_ids)
+            ],
+            total_frames=frames_page.total,
+            offset=offset,
+            has_more=offset + len(page_ids) < frames_page.total,
         )
 
     async def _compute_diversity_metrics(
         self, job_id: UUID, camera: str
-    ) -> tuple[dict[str, str], dict[str, float]]:
+    ) -> tuple[dict[str, bytes], dict[str, float]]:
         """Compute perceptual hashes and motion scores for all frames."""
         frames_list = await self.data_service.list_frames(str(job_id), limit=10000)
 
-        perceptual_hashes: dict[str, str] = {}
+        perceptual_hashes: dict[str, bytes] = {}
         motion_scores: dict[str, float] = {}
 
-        prev_path: Path | None = None
-
-        for frame in frames_list.frames:
-            frame_id = frame.frame_id
-
-            # Get image path
-            image_path = await self.data_service.get_frame_file_path(
-                str(job_id), frame_id, camera
-            )
-            if not image_path or not image_path.exists():
-                continue
-
-            # Compute perceptual hash
-            try:
-                img = Image.open(image_path)
-                perceptual_hashes[frame_id] = compute_dhash(img)
-            except Exception as e:
-                logger.warning(f"Error hashing frame {frame_id}: {e}")
-
-            # Compute motion score (relative to previous frame)
-            if prev_path and prev_path.exists():
-                motion_scores[frame_id] = compute_motion_score(prev_path, image_path)
-            else:
-                motion_scores[frame_id] = 1.0  # First frame has "full motion"
+        # Resolve image paths for frames that have one, in frame order
+        frame_ids = [frame.frame_id for frame in frames_list.frames]
+        image_paths = await self.data_service.get_frame_file_paths(
+            str(job_id), frame_ids, camera
+        )
+        frame_paths = [
+            (frame_id, image_paths[frame_id])
+            for frame_id in frame_ids
+            if frame_id in image_paths
+        ]
+
+        loop = asyncio.get_running_loop()
+
+        # Previous frame's decoded pixels, carried across windows
+        has_prev = False
+        prev_gray: np.ndarray | None = None
+
+        # Decode and hash a window of frames at a time in a thread pool (PIL and
+        # NumPy release the GIL), keeping at most one window of frames in memory
+        with ThreadPoolExecutor(max_workers=DIVERSITY_WORKERS) as pool:
+            for start in range(0, len(frame_paths), DIVERSITY_WINDOW):
+                window = frame_paths[start : start + DIVERSITY_WINDOW]
+                decoded = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _decode_frame, path) for _, path in window)
+                )
 
-            prev_path = image_path
+                # Pair each frame with its predecessor for motion scoring
+                pairs: list[tuple[str, np.ndarray, np.ndarray]] = []
+                for (frame_id, _), result in zip(window, decoded, strict=True):
+                    curr_gray: np.ndarray | None = None
+                    if isinstance(result, Exception):
+                        logger.warning(f"Error hashing frame {frame_id}: {result}")
+                    else:
+                        perceptual_hashes[frame_id], curr_gray = result
+
+                    if not has_prev:
+                        motion_scores[frame_id] = 1.0  # First frame has "full motion"
+                    elif prev_gray is not None and curr_gray is not None:
+                        pairs.append((frame_id, prev_gray, curr_gray))
+                    else:
+                        motion_scores[frame_id] = 0.0  # Unreadable frame on either side
+
+                    has_prev = True
+                    prev_gray = curr_gray
+
+                scores = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, compute_motion_score, prev, curr)
+                        for _, prev, curr in pairs
+                    )
+                )
+                for (frame_id, _, _), score in zip(pairs, scores, strict=True):
+                    motion_scores[frame_id] = score
 
         return perceptual_hashes, motion_scores
 
     async def _save_to_cache(
         self,
         job_id: UUID,
+        cache: FrameDiversityCache | None,
         camera: str,
-        perceptual_hashes: dict[str, str],
+        perceptual_hashes: dict[str, bytes],
         motion_scores: dict[str, float],
     ) -> None:
         """Save computed metrics to database cache."""
-        # Check if cache entry exists
-        cache = await self.get_cached_analysis(job_id)
+        frame_ids = list(perceptual_hashes)
+        hash_blob = pack_hash_blob(frame_ids, perceptual_hashes)
+
+        if (
+            cache
+            and cache.status == "complete"
+            and cache.camera == camera
+            and cache.frame_ids == frame_ids
+            and cache.perceptual_hashes == hash_blob
+            and cache.motion_scores == motion_scores
+        ):
+            # Recomputed metrics match the cache; skip rewriting it
+            return
 
         if cache:
             # Update existing
             cache.camera = camera
-            cache.perceptual_hashes = perceptual_hashes
+            cache.frame_ids = frame_ids
+            cache.perceptual_hashes = hash_blob
             cache.motion_scores = motion_scores
             cache.status = "complete"
             cache.analyzed_frames = len(perceptual_hashes)
@@ -248,7 +496,8 @@ class DiversityService:
             cache = FrameDiversityCache(
                 job_id=job_id,
                 camera=camera,
-                perceptual_hashes=perceptual_hashes,
+                frame_ids=frame_ids,
+                perceptual_hashes=hash_blob,
                 motion_scores=motion_scores,
                 status="complete",
                 analyzed_frames=len(perceptual_hashes),
@@ -262,11 +511,11 @@ class DiversityService:
     def _select_diverse_frames(
         self,
         frame_ids: list[str],
-        hashes: dict[str, str],
+        hashes: dict[str, bytes],
         motion_scores: dict[str, float],
         similarity_threshold: float,
         motion_threshold: float,
-    ) -> tuple[list[int], list[int], list[FrameCluster]]:
+    ) -> tuple[list[int], list[int], list[FrameCluster], int]:
         """
         Select diverse frames using combined similarity and motion filtering.
 
@@ -274,6 +523,7 @@ class DiversityService:
             - List of selected frame indices
             - List of excluded frame indices
             - List of similarity clusters
+            - Number of low-motion frames
         """
         selected: list[int] = []
         excluded: list[int] = []
@@ -282,52 +532,38 @@ class DiversityService:
         # Track which frames belong to which cluster
         cluster_map: dict[int, list[int]] = {}  # representative_index -> member_indices
 
-        for i, frame_id in enumerate(frame_ids):
-            frame_hash = hashes.get(frame_id, "")
-            frame_motion = motion_scores.get(frame_id, 1.0)
+        # Pack every hash once into a single matrix
+        packed, hash_bits = pack_hashes([hashes.get(fid, b"") for fid in frame_ids])
 
-            # Skip low-motion frames (except first in sequence)
-            if i > 0 and frame_motion < motion_threshold:
-                excluded.append(i)
-                continue
-
-            # Check similarity against already selected frames
-            is_duplicate = False
-            similar_to: int | None = None
+        # Skip low-motion frames (except first in sequence)
+        low_motion = np.array(
+            [motion_scores.get(fid, 1.0) < motion_threshold for fid in frame_ids],
+            dtype=bool,
+        )
+        low_motion[:1] = False
 
-            for sel_idx in selected:
-                sel_frame_id = frame_ids[sel_idx]
-                sel_hash = hashes.get(sel_frame_id, "")
+        assignment, similarity = assign_clusters(
+            packed, hash_bits, low_motion, similarity_threshold
+        )
 
-                if frame_hash and sel_hash:
-                    similarity = compute_hash_similarity(frame_hash, sel_hash)
-                    if similarity > similarity_threshold:
-                        is_duplicate = True
-                        similar_to = sel_idx
-                        break
+        for i, similar_to in enumerate(assignment.tolist()):
+            if similar_to == i:
+                selected.append(i)
+                continue
 
-            if is_duplicate and similar_to is not None:
-                excluded.append(i)
+            excluded.append(i)
+            if similar_to >= 0:
                 # Add to cluster
                 if similar_to not in cluster_map:
                     cluster_map[similar_to] = [similar_to]
                 cluster_map[similar_to].append(i)
-            else:
-                selected.append(i)
 
         # Build cluster objects
         for rep_idx, member_indices in cluster_map.items():
             if len(member_indices) > 1:  # Only include actual clusters
-                # Calculate average similarity within cluster
-                rep_hash = hashes.get(frame_ids[rep_idx], "")
-                similarities = []
-                for mem_idx in member_indices:
-                    if mem_idx != rep_idx:
-                        mem_hash = hashes.get(frame_ids[mem_idx], "")
-                        if rep_hash and mem_hash:
-                            similarities.append(
-                                compute_hash_similarity(rep_hash, mem_hash)
-                            )
+                # Average similarity within cluster, from the similarities
+                # recorded when each member joined it
+                similarities = similarity[member_indices[1:]].tolist()
 
                 avg_sim = sum(similarities) / len(similarities) if similarities else 0.0
 
@@ -339,4 +575,4 @@ class DiversityService:
                     )
                 )
 
-        return selected, excluded, clusters
+        return selected, excluded, clusters, int(low_motion.sum())
@@ -6,8 +6,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from backend.app.config import get_settings
 from backend.app.constants import DEFAULT_PIPELINE_STAGES
@@ -136,7 +137,7 @@ class JobService:
             name=job_data.name,
             input_paths=input_paths,
             output_directory=job_data.output_directory,
-            config_id=config.id,
+            config=config,
             stages_to_run=stages_to_run,
             dataset_id=dataset_id,
         )
@@ -144,55 +145,64 @@ class JobService:
         await self.db.flush()
 
         logger.info(f"Created job {job.id}: {job.name} with stages {stages_to_run}")
-        return self._to_response(job, config)
+        return self._to_response(job)
 
     async def get_job(self, job_id: UUID) -> JobResponse | None:
         """Get job by ID."""
         result = await self.db.execute(
-            select(ProcessingJob, JobConfig)
-            .join(JobConfig)
+            select(ProcessingJob)
+            .options(selectinload(ProcessingJob.config))
             .where(ProcessingJob.id == job_id)
         )
-        row = result.first()
-        if row is None:
+        job = result.scalar_one_or_none()
+        if job is None:
             return None
-        return self._to_response(row[0], row[1])
+        return self._to_response(job)
 
     async def list_jobs(
         self, status: str | None = None, limit: int = 20, offset: int = 0
     ) -> tuple[list[JobResponse], int]:
         """List jobs with optional filtering."""
-        query = select(ProcessingJob, JobConfig).join(JobConfig)
-        count_query = select(func.count(ProcessingJob.id))
+        # The window count returns the total alongside each page row
+        query = select(ProcessingJob, func.count().over().label("total")).options(
+            selectinload(ProcessingJob.config)
+        )
 
         if status:
             query = query.where(ProcessingJob.status == status)
-            count_query = count_query.where(ProcessingJob.status == status)
-
-        # Get total count using scalar count (efficient)
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
 
         # Get paginated results
         query = query.order_by(ProcessingJob.created_at.desc())
         query = query.offset(offset).limit(limit)
         result = await self.db.execute(query)
-
-        jobs = [self._to_response(row[0], row[1]) for row in result.all()]
+        rows = result.all()
+
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # Page is past the end, so no row carries the window count
+            count_query = select(func.count()).select_from(ProcessingJob)
+            if status:
+                count_query = count_query.where(ProcessingJob.status == status)
+            total = (await self.db.execute(count_query)).scalar_one()
+        else:
+            total = 0
+
+        jobs = [self._to_response(row[0]) for row in rows]
         return jobs, total
 
     async def start_job(self, job_id: UUID) -> JobStatusUpdate | None:
         """Start a pending job."""
         result = await self.db.execute(
-            select(ProcessingJob, JobConfig)
-            .join(JobConfig)
+            select(ProcessingJob)
+            .options(selectinload(ProcessingJob.config))
             .where(ProcessingJob.id == job_id)
         )
-        row = result.first()
-        if row is None:
+        job = result.scalar_one_or_none()
+        if job is None:
             return None
 
-        job, config = row[0], row[1]
+        config = job.config
 
         if job.status != "pending":
             return JobStatusUpdate(
@@ -273,83 +283,87 @@ class JobService:
 
     async def pause_job(self, job_id: UUID) -> JobStatusUpdate | None:
         """Pause a running job."""
-        result = await self.db.execute(
-            select(ProcessingJob).where(ProcessingJob.id == job_id)
+        return await self._transition_job(
+            job_id, ("running",), "pause", "Paused", status="paused"
         )
-        job = result.scalar_one_or_none()
-        if job is None:
-            return None
-
-        if job.status != "running":
-            return JobStatusUpdate(
-                id=job_id,
-                status=job.status,
-                message=f"Cannot pause job in {job.status} status",
-            )
-
-        job.status = "paused"
-        await self.db.commit()
-
-        logger.info(f"Paused job {job_id}")
-        return JobStatusUpdate(id=job_id, status="paused", message="Job paused")
 
     async def resume_job(self, job_id: UUID) -> JobStatusUpdate | None:
         """Resume a paused job."""
-        result = await self.db.execute(
-            select(ProcessingJob).where(ProcessingJob.id == job_id)
+        return await self._transition_job(
+            job_id, ("paused",), "resume", "Resumed", status="running"
         )
-        job = result.scalar_one_or_none()
-        if job is None:
-            return None
 
-        if job.status != "paused":
-            return JobStatusUpdate(
-                id=job_id,
-                status=job.status,
-                message=f"Cannot resume job in {job.status} status",
-            )
+    async def cancel_job(self, job_id: UUID) -> JobStatusUpdate | None:
+        """Cancel a running or paused job."""
+        return await self._transition_job(
+            job_id,
+            ("running", "paused", "pending"),
+            "cancel",
+            "Cancelled",
+            status="cancelled",
+            completed_at=datetime.now(timezone.utc),
+        )
 
-        job.status = "running"
-        await self.db.commit()
+    async def _transition_job(
+        self,
+        job_id: UUID,
+        allowed_statuses: tuple[str, ...],
+        action: str,
+        done: str,
+        **values,
+    ) -> JobStatusUpdate | None:
+        """
+        Atomically apply a status transition with a single conditional UPDATE.
 
-        logger.info(f"Resumed job {job_id}")
-        return JobStatusUpdate(id=job_id, status="running", message="Job resumed")
+        The job is only updated if it is currently in one of allowed_statuses,
+        so concurrent transitions cannot overwrite each other.
 
-    async def cancel_job(self, job_id: UUID) -> JobStatusUpdate | None:
-        """Cancel a running or paused job."""
+        Returns:
+            None if the job does not exist, otherwise the resulting status update
+        """
         result = await self.db.execute(
-            select(ProcessingJob).where(ProcessingJob.id == job_id)
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.id == job_id,
+                ProcessingJob.status.in_(allowed_statuses),
+            )
+            .values(**values)
+            .returning(ProcessingJob.status)
         )
-        job = result.scalar_one_or_none()
-        if job is None:
-            return None
-
-        if job.status not in ("running", "paused", "pending"):
+        new_status = result.scalar_one_or_none()
+
+        if new_status is None:
+            # Not updated: either missing or in a state that does not allow it
+            current_status = (
+                await self.db.execute(
+                    select(ProcessingJob.status).where(ProcessingJob.id == job_id)
+                )
+            ).scalar_one_or_none()
+            if current_status is None:
+                return None
             return JobStatusUpdate(
                 id=job_id,
-                status=job.status,
-                message=f"Cannot cancel job in {job.status} status",
+                status=current_status,
+                message=f"Cannot {action} job in {current_status} status",
             )
 
-        job.status = "cancelled"
-        job.completed_at = datetime.now(timezone.utc)
         await self.db.commit()
 
-        logger.info(f"Cancelled job {job_id}")
-        return JobStatusUpdate(id=job_id, status="cancelled", message="Job cancelled")
+        logger.info(f"{done} job {job_id}")
+        return JobStatusUpdate(id=job_id, status=new_status, message=f"Job {done.lower()}")
 
     async def restart_job(self, job_id: UUID) -> JobStatusUpdate | None:
         """Restart a failed or cancelled job."""
         result = await self.db.execute(
-            select(ProcessingJob, JobConfig)
-            .join(JobConfig)
+            select(ProcessingJob)
+            .options(selectinload(ProcessingJob.config))
             .where(ProcessingJob.id == job_id)
         )
-        row = result.first()
-        if row is None:
+        job = result.scalar_one_or_none()
+        if job is None:
             return None
 
-        job, config = row[0], row[1]
+        config = job.config
 
         if job.status not in ("failed", "cancelled"):
             return JobStatusUpdate(
@@ -527,9 +541,7 @@ class JobService:
         frames_per_second = getattr(job, 'frames_per_second', None)
 
         # Get model variant for segmentation FPS lookup
-        model_variant = "default"
-        if hasattr(job, 'config') and job.config:
-            model_variant = job.config.sam3_model_variant or "default"
+        model_variant = job.config.sam3_model_variant or "default"
 
         def get_default_fps(stage_name: str) -> float:
             """Get default FPS for a stage."""
@@ -701,8 +713,10 @@ class JobService:
 
         return total_eta_seconds, stage_etas, frames_per_second
 
-    def _to_response(self, job: ProcessingJob, config: JobConfig) -> JobResponse:
-        """Convert job model to response schema."""
+    def _to_response(self, job: ProcessingJob) -> JobResponse:
+        """Convert job model (with its config loaded) to response schema."""
+        config = job.config
+
         # Get stages_to_run with default fallback
         stages_to_run = job.stages_to_run or [
             *DEFAULT_PIPELINE_STAGES
@@ -7,6 +7,7 @@ import type {
   AnnotationStatsResponse,
   DiversityAnalysisRequest,
   DiversityAnalysisResponse,
+  DiversityFrameDetailsResponse,
   FrameBatchResponse,
   TrainingDatasetDetail,
   TrainingDatasetListResponse,
@@ -76,6 +77,23 @@ export const reviewService = {
     return data;
   },
 
+  /**
+   * Get a page of per-frame hashes and motion scores from the cached analysis.
+   */
+  getDiversityFrameDetails: async (
+    jobId: string,
+    offset: number = 0,
+    limit: number = 500
+  ): Promise<DiversityFrameDetailsResponse> => {
+    const { data } = await api.get<DiversityFrameDetailsResponse>(
+      `/review/jobs/${jobId}/diversity/frame-details`,
+      {
+        params: { offset, limit },
+      }
+    );
+    return data;
+  },
+
   /**
    * Create a new training dataset from filtered job results.
    */
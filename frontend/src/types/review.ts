@@ -30,6 +30,7 @@ export interface DiversityAnalysisRequest {
   similarity_threshold: number;
   motion_threshold: number;
   sample_camera: 'left' | 'right';
+  include_details?: boolean;
 }
 
 export interface FrameCluster {
@@ -54,6 +55,21 @@ export interface DiversityAnalysisResponse {
   motion_scores: Record<number, number>;
 }
 
+export interface DiversityFrameDetail {
+  frame_index: number;
+  frame_id: string;
+  perceptual_hash: string;
+  motion_score: number;
+}
+
+export interface DiversityFrameDetailsResponse {
+  job_id: string;
+  frames: DiversityFrameDetail[];
+  total_frames: number;
+  offset: number;
+  has_more: boolean;
+}
+
 // =============================================================================
 // Filter Configuration
 // =============================================================================
@@ -0,0 +1 @@
+"""Lightweight helpers shared by the API and the worker (no SDK or OpenCV imports)."""
@@ -0,0 +1,205 @@
+"""Per-job SQLite index of extracted frame metadata.
+
+The worker maintains ``{job_output_dir}/index.sqlite``: every stage that
+rewrites a sequence's frame_registry.json calls update_frame_index() next to
+write_sequence_summary(), which replaces that sequence's rows. The index
+records the mtime and size of each registry it was built from.
+
+The API only reads the index, through a read-only connection. query_frame_page()
+returns None when the index is missing or does not match the registries on disk
+(while extraction is still running, or for jobs extracted before the index
+existed), and callers fall back to reading the registries.
+
+Frame detail and the data summary are not served from here: frame detail needs
+the full registry entry, which the API resolves through its cached per-sequence
+registry index, and the data summary is read from the summary.json sidecars.
+"""
+
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite"
+
+# Seconds to wait for a concurrent writer (another sequence's stage) to finish
+_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sequences (
+    seq_name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    svo2_file TEXT,
+    frame_skip INTEGER
+);
+CREATE TABLE IF NOT EXISTS frames (
+    seq_name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    frame_id TEXT NOT NULL,
+    svo2_file TEXT NOT NULL,
+    sequence_index INTEGER NOT NULL,
+    svo2_frame_index INTEGER,
+    timestamp_ns INTEGER,
+    has_left INTEGER NOT NULL,
+    has_right INTEGER NOT NULL,
+    has_depth INTEGER NOT NULL,
+    has_pointcloud INTEGER NOT NULL,
+    has_imu INTEGER NOT NULL,
+    detection_count INTEGER NOT NULL,
+    PRIMARY KEY (seq_name, position)
+);
+CREATE INDEX IF NOT EXISTS ix_frames_sequence_index
+    ON frames (sequence_index, seq_name, position);
+CREATE INDEX IF NOT EXISTS ix_frames_frame_id ON frames (frame_id);
+"""
+
+_FRAME_COLUMNS = (
+    "frame_id, svo2_file, sequence_index, svo2_frame_index, timestamp_ns, "
+    "has_left, has_right, has_depth, has_pointcloud, has_imu, detection_count"
+)
+
+
+def _registry_fingerprint(output_dir: Path) -> list[tuple[str, int, int]]:
+    """Return (sequence name, mtime_ns, size) for every frame registry in a job."""
+    fingerprint = []
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            try:
+                st = os.stat(os.path.join(entry.path, "frame_registry.json"))
+            except OSError:
+                continue
+            fingerprint.append((entry.name, st.st_mtime_ns, st.st_size))
+    fingerprint.sort()
+    return fingerprint
+
+
+def update_frame_index(seq_dir: Path) -> None:
+    """
+    Replace one sequence's rows in its job's frame index.
+
+    Should be called whenever a stage rewrites the sequence's
+    frame_registry.json. Failures are logged and never raised, so a broken
+    index cannot fail a pipeline stage; readers fall back to the registries.
+    """
+    seq_name = seq_dir.name
+    registry_file = seq_dir / "frame_registry.json"
+    try:
+        st = registry_file.stat()
+        try:
+            registry = orjson.loads(registry_file.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load frame registry {registry_file}: {e}")
+            registry = None
+
+        frames = []
+        if registry is None:
+            sequence = (seq_name, st.st_mtime_ns, st.st_size, None, None)
+        else:
+            svo2_file = registry.get("svo2_file", seq_name)
+            frame_skip = registry.get("config", {}).get("frame_skip", 1)
+            sequence = (seq_name, st.st_mtime_ns, st.st_size, svo2_file, frame_skip)
+
+            append = frames.append
+            for position, frame in enumerate(registry.get("frames", [])):
+                get = frame.get
+                append((
+                    seq_name,
+                    position,
+                    get("frame_id", ""),
+                    svo2_file,
+                    get("sequence_index", 0),
+                    get("svo2_frame_index"),
+                    get("timestamp_ns"),
+                    bool(get("image_left")),
+                    bool(get("image_right")),
+                    bool(get("depth")),
+                    bool(get("point_cloud")),
+                    bool(get("imu")),
+                    get("detection_count", 0),
+                ))
+
+        index_file = seq_dir.parent / INDEX_FILENAME
+        with closing(sqlite3.connect(index_file, timeout=_BUSY_TIMEOUT)) as conn:
+            conn.executescript(_SCHEMA)
+            with conn:
+                conn.execute("DELETE FROM sequences WHERE seq_name = ?", (seq_name,))
+                conn.execute("DELETE FROM frames WHERE seq_name = ?", (seq_name,))
+                conn.execute("INSERT INTO sequences VALUES (?, ?, ?, ?, ?)", sequence)
+                conn.executemany(
+                    "INSERT INTO frames VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    frames,
+                )
+    except Exception as e:
+        logger.warning(f"Failed to update frame index for {seq_dir}: {e}")
+        return
+
+    logger.info(f"Updated frame index for {seq_dir}: {len(frames)} frames")
+
+
+def _open_current_index(output_dir: Path) -> sqlite3.Connection | None:
+    """
+    Open a job's frame index read-only, if it exists and matches the registries.
+
+    Raises:
+        sqlite3.Error: If the index exists but cannot be read
+    """
+    index_file = output_dir / INDEX_FILENAME
+    if not index_file.exists():
+        return None
+
+    conn = sqlite3.connect(
+        f"{index_file.resolve().as_uri()}?mode=ro", uri=True, timeout=_BUSY_TIMEOUT
+    )
+    try:
+        conn.row_factory = sqlite3.Row
+        stored = conn.execute(
+            "SELECT seq_name, mtime_ns, size FROM sequences ORDER BY seq_name"
+        ).fetchall()
+        if [tuple(row) for row in stored] != _registry_fingerprint(output_dir):
+            conn.close()
+            return None
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def query_frame_page(
+    output_dir: Path,
+    limit: int,
+    offset: int,
+) -> tuple[int, list[sqlite3.Row], sqlite3.Row | None] | None:
+    """
+    Get one page of frames ordered by sequence index.
+
+    Returns:
+        Tuple of (total frames, frame rows, last sequence's svo2_file/frame_skip row),
+        or None if the job has no current index
+
+    Raises:
+        sqlite3.Error: If the index exists but cannot be read
+    """
+    conn = _open_current_index(output_dir)
+    if conn is None:
+        return None
+
+    with closing(conn):
+        total = conn.execute("SELECT COUNT(*) FROM frames").fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {_FRAME_COLUMNS} FROM frames "
+            "ORDER BY sequence_index, seq_name, position LIMIT ? OFFSET ?",
+            (limit, offset),
+        ).fetchall()
+        last_sequence = conn.execute(
+            "SELECT svo2_file, frame_skip FROM sequences "
+            "WHERE svo2_file IS NOT NULL ORDER BY seq_name DESC LIMIT 1"
+        ).fetchone()
+    return total, rows, last_sequence
@@ -0,0 +1,139 @@
+"""Per-sequence summary sidecar with precomputed frame and detection counts."""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "summary.json"
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    """Return [mtime_ns, size] for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _source_signatures(seq_dir: Path) -> dict[str, list[int] | None]:
+    """Signatures of the files a sequence summary is computed from."""
+    return {
+        "frame_registry": _file_signature(seq_dir / "frame_registry.json"),
+        "detections": _file_signature(seq_dir / "detections" / "detections.json"),
+    }
+
+
+def count_detections_by_class(detections_file: Path) -> Counter[str]:
+    """
+    Count detections per class in a detections.json file.
+
+    Streams the per-frame entries with ijson when available so peak memory
+    stays bounded by a single frame instead of the whole document.
+    """
+    by_class: Counter[str] = Counter()
+    with open(detections_file, "rb") as f:
+        if IJSON_AVAILABLE:
+            frames = (frame_data for _frame_id, frame_data in ijson.kvitems(f, "frames"))
+        else:
+            frames = json.load(f).get("frames", {}).values()
+        for frame_data in frames:
+            by_class.update(
+                det.get("class_name", "unknown") for det in frame_data.get("detections", [])
+            )
+    return by_class
+
+
+def build_sequence_summary(seq_dir: Path) -> dict | None:
+    """
+    Compute the summary for a sequence directory.
+
+    Args:
+        seq_dir: Sequence output directory containing frame_registry.json
+
+    Returns:
+        Summary dict, or None if the sequence has no frame registry
+    """
+    sources = _source_signatures(seq_dir)
+    if sources["frame_registry"] is None:
+        return None
+
+    with open(seq_dir / "frame_registry.json") as f:
+        registry = json.load(f)
+
+    frames = registry.get("frames", [])
+    left = right = depth = pointcloud = detections = 0
+    for frame in frames:
+        get = frame.get
+        if get("image_left"):
+            left += 1
+        if get("image_right"):
+            right += 1
+        if get("depth"):
+            depth += 1
+        if get("point_cloud"):
+            pointcloud += 1
+        detections += get("detection_count", 0)
+
+    counts = {
+        "frames": len(frames),
+        "left": left,
+        "right": right,
+        "depth": depth,
+        "pointcloud": pointcloud,
+        "detections": detections,
+    }
+
+    by_class: Counter[str] = Counter()
+    if sources["detections"] is not None:
+        by_class = count_detections_by_class(seq_dir / "detections" / "detections.json")
+
+    return {
+        "svo2_file": registry.get("svo2_file", seq_dir.name),
+        "total_frames": registry.get("total_frames"),
+        "frame_skip": registry.get("config", {}).get("frame_skip", 1),
+        "counts": counts,
+        "by_class": dict(by_class),
+        "sources": sources,
+    }
+
+
+def write_sequence_summary(seq_dir: Path) -> Path | None:
+    """
+    Write summary.json for a sequence directory.
+
+    Should be called whenever a stage rewrites frame_registry.json or
+    detections/detections.json so readers can skip parsing them.
+
+    Returns:
+        Path to the summary file, or None if it could not be written
+    """
+    try:
+        summary = build_sequence_summary(seq_dir)
+        if summary is None:
+            return None
+
+        summary_file = seq_dir / SUMMARY_FILENAME
+        with open(summary_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        return summary_file
+    except Exception as e:
+        logger.warning(f"Failed to write sequence summary for {seq_dir}: {e}")
+        return None
+
+
+def is_summary_current(seq_dir: Path, summary: dict) -> bool:
+    """Check that a summary still matches the files it was computed from."""
+    return summary.get("sources") == _source_signatures(seq_dir)
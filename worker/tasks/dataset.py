@@ -1,7 +1,6 @@
 """Dataset preparation tasks."""
 
 import logging
-import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
@@ -35,6 +34,7 @@ def prepare_dataset_files(self, dataset_id: str) -> dict:
         Result with statistics
     """
     from backend.app.models.dataset import Dataset, DatasetFile
+    from backend.app.services.dataset_service import copy_file_data
 
     logger.info(f"Preparing dataset files: {dataset_id}")
 
@@ -106,7 +106,7 @@ def prepare_dataset_files(self, dataset_id: str) -> dict:
             if not source.exists():
                 raise FileNotFoundError(f"Source file not found: {source}")
 
-            shutil.copy2(source, dest_path)
+            copy_file_data(source, dest_path)
 
             # Update file record in database
             with engine.connect() as conn:
@@ -276,14 +276,9 @@ def scan_dataset_folder(
 
             relative_path = str(svo2_path.relative_to(source_path))
 
-            # Calculate file hash
-            hasher = hashlib.sha256()
-            with open(svo2_path, "rb") as f:
-                hasher.update(f.read(65536))
-            file_hash = hasher.hexdigest()[:16]
-
             # Extract metadata if requested
-            camera_id = file_hash[:8]
+            file_hash = None
+            camera_id = None
             camera_model = None
             camera_serial = None
             frame_count = None
@@ -298,6 +293,8 @@ def scan_dataset_folder(
 
                     with SVO2Reader(svo2_path) as reader:
                         meta = reader.get_metadata()
+                        # The reader already hashes the file header
+                        file_hash = meta["file_hash"]
                         camera_id = str(meta.get("serial_number", file_hash[:8]))
                         camera_model = meta.get("camera_model")
                         camera_serial = str(meta.get("serial_number", ""))
@@ -312,6 +309,15 @@ def scan_dataset_folder(
                 except Exception as e:
                     logger.warning(f"Failed to extract metadata from {svo2_path}: {e}")
 
+            # Calculate file hash unless the reader provided it
+            if file_hash is None:
+                hasher = hashlib.sha256()
+                with open(svo2_path, "rb") as f:
+                    hasher.update(f.read(65536))
+                file_hash = hasher.hexdigest()[:16]
+            if camera_id is None:
+                camera_id = file_hash[:8]
+
             # Insert file record
             with engine.connect() as conn:
                 conn.execute(
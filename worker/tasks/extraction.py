@@ -29,20 +29,18 @@ def compute_dhash(image: Image.Image, hash_size: int = 16) -> str:
     Compute difference hash (dHash) for an image.
     Fast and effective for detecting near-duplicates.
     """
-    resized = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
-    pixels = np.array(resized)
+    resized = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+    pixels = np.asarray(resized)
     diff = pixels[:, 1:] > pixels[:, :-1]
-    return "".join(format(byte, "02x") for byte in np.packbits(diff.flatten()))
+    return np.packbits(diff.ravel()).tobytes().hex()
 
 
 def compute_hash_similarity(hash1: str, hash2: str) -> float:
     """Compute similarity between two hashes using Hamming distance (0-1)."""
     if len(hash1) != len(hash2):
         return 0.0
-    bits1 = bin(int(hash1, 16))[2:].zfill(len(hash1) * 4)
-    bits2 = bin(int(hash2, 16))[2:].zfill(len(hash2) * 4)
-    diff_count = sum(b1 != b2 for b1, b2 in zip(bits1, bits2, strict=True))
-    return 1.0 - (diff_count / len(bits1))
+    diff_count = (int(hash1, 16) ^ int(hash2, 16)).bit_count()
+    return 1.0 - (diff_count / (len(hash1) * 4))
 
 
 def compute_motion_score(prev_image: np.ndarray, curr_image: np.ndarray) -> float:
@@ -122,7 +120,9 @@ def apply_diversity_filter(
             frame_data.append({"frame": frame_info, "hash": "", "motion": 1.0, "keep": True})
 
     # Apply diversity selection
-    selected_hashes: list[str] = []
+    # Selected hashes are kept as (hex length, int value) so each hash is
+    # parsed once instead of once per comparison
+    selected_hashes: list[tuple[int, int]] = []
 
     for i, fd in enumerate(frame_data):
         if not fd["hash"]:
@@ -134,9 +134,14 @@ def apply_diversity_filter(
             continue
 
         # Check similarity against selected frames
+        hash_len = len(fd["hash"])
+        hash_int = int(fd["hash"], 16)
+        nbits = hash_len * 4
         is_duplicate = False
-        for sel_hash in selected_hashes:
-            similarity = compute_hash_similarity(fd["hash"], sel_hash)
+        for sel_len, sel_int in selected_hashes:
+            if sel_len != hash_len:
+                continue
+            similarity = 1.0 - (hash_int ^ sel_int).bit_count() / nbits
             if similarity > similarity_threshold:
                 is_duplicate = True
                 break
@@ -144,7 +149,7 @@ def apply_diversity_filter(
         if is_duplicate:
             fd["keep"] = False
         else:
-            selected_hashes.append(fd["hash"])
+            selected_hashes.append((hash_len, hash_int))
 
     # Remove non-diverse frames from disk
     frames_removed = 0
@@ -332,6 +337,8 @@ def extract_svo2(
     Returns:
         Extraction result with frame registry path
     """
+    from processing.common.frame_index import update_frame_index
+    from processing.common.sequence_summary import write_sequence_summary
     from processing.svo2.extractor import ExtractionConfig, SVO2Extractor
     from processing.svo2.reader import SVO2Reader
 
@@ -437,6 +444,11 @@ def extract_svo2(
 
             logger.info(f"Diversity filter: kept {frames_kept}, removed {frames_removed_by_diversity}")
 
+        # Precompute per-sequence counts and the frame index for the data API
+        if result.frame_registry_file:
+            write_sequence_summary(Path(result.frame_registry_file).parent)
+            update_frame_index(Path(result.frame_registry_file).parent)
+
         # Ingest frame registry into database for lineage tracking
         # (original_filename and original_unix_timestamp already extracted above)
         ingested_frames = 0
@@ -42,6 +42,8 @@ def run_reconstruction(
     Returns:
         Reconstruction result summary
     """
+    from processing.common.frame_index import update_frame_index
+    from processing.common.sequence_summary import write_sequence_summary
     from processing.reconstruction.bbox_estimator import BBox3DEstimator, BBoxMethod
     from processing.reconstruction.depth_projection import CameraIntrinsics, DepthProjector
     from processing.svo2.frame_registry import FrameRegistry
@@ -264,6 +266,9 @@ def run_reconstruction(
                     json.dump(detections_data, f, indent=2)
                 logger.info("Updated detections.json with distance values")
 
+            write_sequence_summary(registry_path.parent)
+            update_frame_index(registry_path.parent)
+
         logger.info(f"Reconstruction complete: {total_objects} 3D objects in {total_frames} frames")
 
         return {
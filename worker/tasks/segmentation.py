@@ -40,6 +40,8 @@ def run_segmentation(
     Returns:
         Segmentation result summary
     """
+    from processing.common.frame_index import update_frame_index
+    from processing.common.sequence_summary import write_sequence_summary
     from processing.sam3.batch_processor import BatchConfig, SAM3BatchProcessor
     from processing.sam3.predictor import SAM3Config, SAM3Predictor
     from processing.svo2.frame_registry import FrameRegistry
@@ -148,6 +150,8 @@ def run_segmentation(
 
             # Update registry
             registry.save()
+            write_sequence_summary(registry_path.parent)
+            update_frame_index(registry_path.parent)
 
         # Unload model
         predictor.unload()
@@ -42,6 +42,8 @@ def run_tracking(
     Returns:
         Tracking result summary
     """
+    from processing.common.frame_index import update_frame_index
+    from processing.common.sequence_summary import write_sequence_summary
     from processing.svo2.frame_registry import FrameRegistry
     from processing.tracking.bytetrack import ByteTrackConfig
     from processing.tracking.track_manager import TrackManager
@@ -167,6 +169,8 @@ def run_tracking(
                 )
 
             registry.save()
+            write_sequence_summary(registry_path.parent)
+            update_frame_index(registry_path.parent)
 
             # Save tracks for this sequence
             tracks_file = registry_path.parent / "tracks.json"